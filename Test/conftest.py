@@ -1,14 +1,20 @@
 """Pytest configuration - OSS EDITION COMPATIBLE VERSION WITH LAZY IMPORTS"""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timezone
+from types import MappingProxyType
 import sys
 
 # ============================================================================
 # LAZY IMPORT SYSTEM - Avoid circular imports during test collection
 # ============================================================================
 
+# Shared event timestamp - no test asserts on wall-clock accuracy, so fixtures
+# reuse one value instead of calling datetime.now() on every materialization
+_FROZEN_NOW = datetime.now(timezone.utc)
+
 # Global flags to track what's available (initialized as None)
 _MODELS_AVAILABLE = None
 _POLICY_ENGINE_AVAILABLE = None
@@ -132,103 +138,62 @@ def _get_policy_engine_class():
 # ============================================================================
 # FIXTURES WITH LAZY IMPORTS
 # ============================================================================
-
-@pytest.fixture
-def sample_event():
-    """Fixture that lazily imports models"""
+# Fixture models are built with model_construct(): the values are known-valid
+# literals, so pydantic validation is skipped. Tests that exercise validation
+# construct their models directly.
+
+# Event variants used by the fixtures below. Severity is given as a name and
+# resolved to EventSeverity (real models) or kept as a string (mocks).
+_EVENT_VARIANTS = {
+    "sample": dict(
+        component="test-service", latency_p99=250.0, error_rate=0.15,
+        throughput=1000, cpu_util=0.65, memory_util=0.70,
+        service_mesh="default", severity="medium",
+    ),
+    "normal": dict(
+        component="test-service", latency_p99=150.0, error_rate=0.02,
+        throughput=2000, cpu_util=0.50, memory_util=0.55,
+        service_mesh="default", severity="low",
+    ),
+    "critical": dict(
+        component="critical-service", latency_p99=5000.0, error_rate=0.45,
+        throughput=100, cpu_util=0.95, memory_util=0.90,
+        severity="critical",
+    ),
+    # error_rate 15% - WILL trigger sample_policy (error_rate > 0.10)
+    "trigger": dict(
+        component="failing-service", latency_p99=300.0, error_rate=0.15,
+        throughput=1000, cpu_util=0.70, memory_util=0.65,
+        service_mesh="default", severity="high",
+    ),
+}
+
+
+def _build_event(**fields):
+    """Build a ReliabilityEvent (or mock event) from plain field values"""
     ReliabilityEvent, _, _, _, EventSeverity = _get_model_classes()
+    fields.setdefault('timestamp', _FROZEN_NOW)
     
     models_info = _lazy_check_models()
     if models_info['available']:
-        return ReliabilityEvent(
-            component="test-service",
-            timestamp=datetime.now(timezone.utc),
-            latency_p99=250.0,
-            error_rate=0.15,
-            throughput=1000,
-            cpu_util=0.65,
-            memory_util=0.70,
-            service_mesh="default",
-            severity=EventSeverity.MEDIUM
-        )
-    else:
-        # Return mock event
-        mock_event = type('MockEvent', (), {
-            'component': 'test-service',
-            'timestamp': datetime.now(timezone.utc),
-            'latency_p99': 250.0,
-            'error_rate': 0.15,
-            'throughput': 1000,
-            'cpu_util': 0.65,
-            'memory_util': 0.70,
-            'service_mesh': 'default',
-            'severity': 'medium'
-        })()
-        return mock_event
+        fields['severity'] = getattr(EventSeverity, fields['severity'].upper())
+        return ReliabilityEvent.model_construct(**fields)
+    return type('MockEvent', (), fields)()
 
 
-@pytest.fixture
-def normal_event():
-    """Normal event fixture with lazy imports"""
-    ReliabilityEvent, _, _, _, EventSeverity = _get_model_classes()
-    
-    models_info = _lazy_check_models()
-    if models_info['available']:
-        return ReliabilityEvent(
-            component="test-service",
-            timestamp=datetime.now(timezone.utc),
-            latency_p99=150.0,
-            error_rate=0.02,
-            throughput=2000,
-            cpu_util=0.50,
-            memory_util=0.55,
-            service_mesh="default",
-            severity=EventSeverity.LOW
-        )
-    else:
-        mock_event = type('MockEvent', (), {
-            'component': 'test-service',
-            'timestamp': datetime.now(timezone.utc),
-            'latency_p99': 150.0,
-            'error_rate': 0.02,
-            'throughput': 2000,
-            'cpu_util': 0.50,
-            'memory_util': 0.55,
-            'service_mesh': 'default',
-            'severity': 'low'
-        })()
-        return mock_event
+# Events are built once per session: ReliabilityEvent is frozen and tests only
+# read these (or derive variants via model_copy).
+@pytest.fixture(scope="session")
+def event_variant():
+    """Lookup for prebuilt events by variant name, e.g. event_variant("critical")"""
+    events = {name: _build_event(**fields) for name, fields in _EVENT_VARIANTS.items()}
+    return events.__getitem__
 
 
-@pytest.fixture
-def critical_event():
-    """Critical event fixture with lazy imports"""
-    ReliabilityEvent, _, _, _, EventSeverity = _get_model_classes()
-    
-    models_info = _lazy_check_models()
-    if models_info['available']:
-        return ReliabilityEvent(
-            component="critical-service",
-            timestamp=datetime.now(timezone.utc),
-            latency_p99=5000.0,
-            error_rate=0.45,
-            throughput=100,
-            cpu_util=0.95,
-            memory_util=0.90,
-            severity=EventSeverity.CRITICAL
-        )
-    else:
-        mock_event = type('MockEvent', (), {
-            'component': 'critical-service',
-            'timestamp': datetime.now(timezone.utc),
-            'latency_p99': 5000.0,
-            'error_rate': 0.45,
-            'throughput': 100,
-            'cpu_util': 0.95,
-            'memory_util': 0.90,
-            'severity': 'critical'
-        })()
-        return mock_event
+@pytest.fixture(scope="session")
+def sample_event(event_variant):
+    """Sample event (medium severity, 15% errors)"""
+    return event_variant("sample")
 
 
 @pytest.fixture
@@ -238,16 +203,16 @@ def sample_policy():
     
     models_info = _lazy_check_models()
     if models_info['available']:
-        return HealingPolicy(
+        return HealingPolicy.model_construct(
             name="Restart on High Errors",
             description="Restart when error rate > 10%",
-            conditions=[PolicyCondition(
+            conditions=[PolicyCondition.model_construct(
                 metric="error_rate",
                 operator="gt",
                 threshold=0.10
             )],
             actions=[HealingAction.RESTART_CONTAINER],
-            cooldown_seconds=300,
+            cool_down_seconds=300,
             enabled=True
         )
     else:
@@ -256,7 +221,7 @@ def sample_policy():
             'description': 'Restart when error rate > 10%',
             'conditions': [_MockPolicyCondition(metric="error_rate", operator="gt", threshold=0.10)],
             'actions': ['restart_container'],
-            'cooldown_seconds': 300,
+            'cool_down_seconds': 300,
             'enabled': True
         })()
         return mock_policy
@@ -269,16 +234,16 @@ def scale_policy():
     
     models_info = _lazy_check_models()
     if models_info['available']:
-        return HealingPolicy(
+        return HealingPolicy.model_construct(
             name="Scale on High CPU",
             description="Scale when CPU > 80%",
-            conditions=[PolicyCondition(
+            conditions=[PolicyCondition.model_construct(
                 metric="cpu_util",
                 operator="gt",
                 threshold=0.80
             )],
             actions=[HealingAction.SCALE_HORIZONTAL],
-            cooldown_seconds=600,
+            cool_down_seconds=600,
             enabled=True
         )
     else:
@@ -287,7 +252,7 @@ def scale_policy():
             'description': 'Scale when CPU > 80%',
             'conditions': [_MockPolicyCondition(metric="cpu_util", operator="gt", threshold=0.80)],
             'actions': ['scale_horizontal'],
-            'cooldown_seconds': 600,
+            'cool_down_seconds': 600,
             'enabled': True
         })()
         return mock_policy
@@ -300,16 +265,16 @@ def rollback_policy():
     
     models_info = _lazy_check_models()
     if models_info['available']:
-        return HealingPolicy(
+        return HealingPolicy.model_construct(
             name="Rollback on Critical",
             description="Rollback on error rate > 30%",
-            conditions=[PolicyCondition(
+            conditions=[PolicyCondition.model_construct(
                 metric="error_rate",
                 operator="gt",
                 threshold=0.30
             )],
             actions=[HealingAction.ROLLBACK_DEPLOYMENT],
-            cooldown_seconds=900,
+            cool_down_seconds=900,
             enabled=True
         )
     else:
@@ -318,7 +283,7 @@ def rollback_policy():
             'description': 'Rollback on error rate > 30%',
             'conditions': [_MockPolicyCondition(metric="error_rate", operator="gt", threshold=0.30)],
             'actions': ['rollback_deployment'],
-            'cooldown_seconds': 900,
+            'cool_down_seconds': 900,
             'enabled': True
         })()
         return mock_policy
@@ -331,16 +296,16 @@ def disabled_policy():
     
     models_info = _lazy_check_models()
     if models_info['available']:
-        return HealingPolicy(
+        return HealingPolicy.model_construct(
             name="Disabled Policy",
             description="Should never execute",
-            conditions=[PolicyCondition(
+            conditions=[PolicyCondition.model_construct(
                 metric="error_rate",
                 operator="gt",
                 threshold=0.01
             )],
             actions=[HealingAction.RESTART_CONTAINER],
-            cooldown_seconds=300,
+            cool_down_seconds=300,
             enabled=False
         )
     else:
@@ -349,7 +314,7 @@ def disabled_policy():
             'description': 'Should never execute',
             'conditions': [_MockPolicyCondition(metric="error_rate", operator="gt", threshold=0.01)],
             'actions': ['restart_container'],
-            'cooldown_seconds': 300,
+            'cool_down_seconds': 300,
             'enabled': False
         })()
         return mock_policy
@@ -365,7 +330,7 @@ def policy_engine():
 @pytest.fixture
 def policy_engine_with_policies(sample_policy, scale_policy):
     """PolicyEngine with policies fixture"""
-    engine = policy_engine()  # Use the fixture
+    engine = _get_policy_engine_class()()
     engine.add_policy(sample_policy)
     engine.add_policy(scale_policy)
     return engine
@@ -380,144 +345,131 @@ def mock_faiss_memory():
     return mock
 
 
+def _create_event(
+    component: str = "test-service",
+    latency_p99: float = 150.0,
+    error_rate: float = 0.05,
+    throughput: int = 1000,
+    cpu_util: float = 0.60,
+    memory_util: float = 0.65,
+    severity: str = "medium"
+):
+    """Build a new event for the given values"""
+    return _build_event(
+        component=component,
+        latency_p99=latency_p99,
+        error_rate=error_rate,
+        throughput=throughput,
+        cpu_util=cpu_util,
+        memory_util=memory_util,
+        severity=severity
+    )
+
+
 @pytest.fixture
 def event_factory():
     """Event factory fixture with lazy imports"""
-    def _create_event(
-        component: str = "test-service",
-        latency_p99: float = 150.0,
-        error_rate: float = 0.05,
-        throughput: int = 1000,
-        cpu_util: float = 0.60,
-        memory_util: float = 0.65,
-        severity: str = "medium"
-    ):
-        ReliabilityEvent, _, _, _, EventSeverity = _get_model_classes()
-        
-        models_info = _lazy_check_models()
-        if models_info['available']:
-            severity_enum = getattr(EventSeverity, severity.upper())
-            return ReliabilityEvent(
-                component=component,
-                timestamp=datetime.now(timezone.utc),
-                latency_p99=latency_p99,
-                error_rate=error_rate,
-                throughput=throughput,
-                cpu_util=cpu_util,
-                memory_util=memory_util,
-                severity=severity_enum
-            )
-        else:
-            mock_event = type('MockEvent', (), {
-                'component': component,
-                'timestamp': datetime.now(timezone.utc),
-                'latency_p99': latency_p99,
-                'error_rate': error_rate,
-                'throughput': throughput,
-                'cpu_util': cpu_util,
-                'memory_util': memory_util,
-                'severity': severity
-            })()
-            return mock_event
     return _create_event
 
 
+def _create_policy(
+    name: str = "Test Policy",
+    metric: str = "error_rate",
+    operator: str = "gt",
+    threshold: float = 0.10,
+    action: str = "restart_container",
+    cool_down_seconds: int = 300,
+    enabled: bool = True
+):
+    """Build a new policy for the given values"""
+    _, HealingPolicy, PolicyCondition, HealingAction, _ = _get_model_classes()
+
+    models_info = _lazy_check_models()
+    if models_info['available']:
+        action_enum = getattr(HealingAction, action.upper()) if hasattr(HealingAction, action.upper()) else HealingAction.RESTART_CONTAINER
+        return HealingPolicy.model_construct(
+            name=name,
+            description=f"Policy for {metric} {operator} {threshold}",
+            conditions=[PolicyCondition.model_construct(
+                metric=metric,
+                operator=operator,
+                threshold=threshold
+            )],
+            actions=[action_enum],
+            cool_down_seconds=cool_down_seconds,
+            enabled=enabled
+        )
+    else:
+        mock_policy = type('MockPolicy', (), {
+            'name': name,
+            'description': f'Policy for {metric} {operator} {threshold}',
+            'conditions': [_MockPolicyCondition(metric=metric, operator=operator, threshold=threshold)],
+            'actions': [action],
+            'cool_down_seconds': cool_down_seconds,
+            'enabled': enabled
+        })()
+        return mock_policy
+
+
 @pytest.fixture
 def policy_factory():
     """Policy factory fixture with lazy imports"""
-    def _create_policy(
-        name: str = "Test Policy",
-        metric: str = "error_rate",
-        operator: str = "gt",
-        threshold: float = 0.10,
-        action: str = "restart_container",
-        cooldown_seconds: int = 300,
-        enabled: bool = True
-    ):
-        _, HealingPolicy, PolicyCondition, HealingAction, _ = _get_model_classes()
-        
-        models_info = _lazy_check_models()
-        if models_info['available']:
-            action_enum = getattr(HealingAction, action.upper()) if hasattr(HealingAction, action.upper()) else HealingAction.RESTART_CONTAINER
-            return HealingPolicy(
-                name=name,
-                description=f"Policy for {metric} {operator} {threshold}",
-                conditions=[PolicyCondition(
-                    metric=metric,
-                    operator=operator,
-                    threshold=threshold
-                )],
-                actions=[action_enum],
-                cooldown_seconds=cooldown_seconds,
-                enabled=enabled
-            )
-        else:
-            mock_policy = type('MockPolicy', (), {
-                'name': name,
-                'description': f'Policy for {metric} {operator} {threshold}',
-                'conditions': [_MockPolicyCondition(metric=metric, operator=operator, threshold=threshold)],
-                'actions': [action],
-                'cooldown_seconds': cooldown_seconds,
-                'enabled': enabled
-            })()
-            return mock_policy
     return _create_policy
 
 
-def pytest_configure(config):
-    """Pytest configuration"""
-    config.addinivalue_line("markers", "slow: marks tests as slow")
-    config.addinivalue_line("markers", "integration: integration tests")
-    config.addinivalue_line("markers", "unit: unit tests")
-    config.addinivalue_line("markers", "oss: OSS-specific tests")
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed (never on Windows)"""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
-@pytest.fixture
-def trigger_event():
-    """Event that triggers sample_policy (error_rate > 0.10)"""
-    ReliabilityEvent, _, _, _, EventSeverity = _get_model_classes()
-    
-    models_info = _lazy_check_models()
-    if models_info['available']:
-        return ReliabilityEvent(
-            component="failing-service",
-            timestamp=datetime.now(timezone.utc),
-            latency_p99=300.0,
-            error_rate=0.15,  # 15% - WILL trigger policy
-            throughput=1000,
-            cpu_util=0.70,
-            memory_util=0.65,
-            service_mesh="default",
-            severity=EventSeverity.HIGH
-        )
-    else:
-        mock_event = type('MockEvent', (), {
-            'component': 'failing-service',
-            'timestamp': datetime.now(timezone.utc),
-            'latency_p99': 300.0,
-            'error_rate': 0.15,
-            'throughput': 1000,
-            'cpu_util': 0.70,
-            'memory_util': 0.65,
-            'service_mesh': 'default',
-            'severity': 'high'
-        })()
-        return mock_event
+# Kept before patching so the stub below can still hand control to the loop
+_REAL_ASYNCIO_SLEEP = asyncio.sleep
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _fast_sleep(request, monkeypatch):
+    """
+    Turn asyncio.sleep() into a bare yield for tests marked ``fast_sleep``.
+
+    Opt-in so that tests relying on real delays (timeouts, cancellation)
+    keep them; the MCP modules mark themselves because the server and client
+    only sleep to simulate processing/RAG latency.
+    """
+    if request.node.get_closest_marker("fast_sleep") is None:
+        return
+
+    async def _sleep(delay, result=None):
+        return await _REAL_ASYNCIO_SLEEP(0, result)
+
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+
+
+# Read-only view: the fixture is session-scoped, so a test that mutated the
+# dict would leak into every later test - this makes that raise instead
+_SAMPLE_METRICS = MappingProxyType({
+    'incident_start': '2025-12-09T09:00:00Z',
+    'incident_detected': '2025-12-09T09:02:00Z',
+    'incident_resolved': '2025-12-09T09:15:00Z',
+    'industry_mttr_minutes': 14.0,
+    'arf_mttr_minutes': 2.0,
+    'time_saved_minutes': 12.0,
+    'cost_per_minute': 1000.0,
+    'cost_savings': 12000.0
+})
+
+
+@pytest.fixture(scope="session")
 def sample_metrics():
     """Sample timeline metrics for testing"""
-    return {
-        'incident_start': '2025-12-09T09:00:00Z',
-        'incident_detected': '2025-12-09T09:02:00Z',
-        'incident_resolved': '2025-12-09T09:15:00Z',
-        'industry_mttr_minutes': 14.0,
-        'arf_mttr_minutes': 2.0,
-        'time_saved_minutes': 12.0,
-        'cost_per_minute': 1000.0,
-        'cost_savings': 12000.0
-    }
+    return _SAMPLE_METRICS
 
 
 @pytest.fixture
@@ -545,16 +497,23 @@ def clear_module_cache():
     return _clear_cache
 
 
+def _purge_arf_modules(keep=frozenset()):
+    """Remove cached agentic_reliability_framework modules, except those listed in keep"""
+    for name in [m for m in sys.modules if m.startswith("agentic_reliability_framework") and m not in keep]:
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture(scope="session")
+def purge_arf_modules():
+    """The ARF module-cache purge, for tests that re-import the package mid-test"""
+    return _purge_arf_modules
+
+
 @pytest.fixture(autouse=True)
-def setup_test_environment():
+def setup_test_environment(request):
     """Auto-use fixture to set up test environment"""
-    # Clear module cache at start of test session to ensure fresh imports
-    import sys
-    test_modules = [m for m in sys.modules.keys() if m.startswith('agentic_reliability_framework')]
-    for module in test_modules:
-        sys.modules.pop(module, None)
-    
-    yield
-    
-    # Clean up after tests
-    pass
+    # Clear the module cache only for tests that need fresh imports; everyone
+    # else reuses the already-imported package
+    if request.node.get_closest_marker("fresh_imports") is None:
+        return
+    _purge_arf_modules()
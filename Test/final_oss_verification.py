@@ -115,7 +115,7 @@ def main():
         ("scripts/verify_circular_fix.py", "Circular import verifier exists"),
         (".pre-commit-config.yaml", "Pre-commit config exists"),
         # FIXED: Removed non-existent file reference
-        # ("Test/verify_import_fix.py", "Import verification test exists"),
+        # ("Test/test_verify_import_fix.py", "Import verification test exists"),
     ]
     
     for filepath, desc in file_checks:
@@ -24,11 +24,9 @@ def test_oss_core_import():
         assert HealingIntent is not None
         assert OSSMCPClient is not None
         print("✅ OSS core components imported")
-        return True
     except ImportError as e:
+        # In some test environments OSS might not be available - warn, don't fail
         print(f"⚠️  OSS import failed: {e}")
-        # In some test environments OSS might not be available
-        return True  # Don't fail, just warn
 
 
 def test_config_exists():
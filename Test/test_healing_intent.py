@@ -3,26 +3,38 @@ HealingIntent Integration Tests
 """
 
 import pytest
-import asyncio
-from datetime import datetime
-from unittest.mock import Mock, AsyncMock, patch
+import time
+from unittest.mock import AsyncMock
 
+pytestmark = pytest.mark.fast_sleep
 
-@pytest.fixture
-def mock_healing_intent():
-    """Create a mock HealingIntent for testing"""
-    class MockHealingIntent:
-        def __init__(self):
-            self.action = "restart_container"
-            self.component = "api-service"
-            self.parameters = {"force": True}
-            self.justification = "High latency detected"
-            self.confidence = 0.85
-            self.incident_id = "inc_123"
-            self.detected_at = datetime.now().timestamp()
-            
-        def to_enterprise_request(self):
-            return {
+# Resolved once for the module; only skips when no HealingIntent is importable
+try:
+    from agentic_reliability_framework.arf_core.models import healing_intent
+except ImportError:
+    healing_intent = pytest.importorskip(
+        "oss.healing_intent", reason="requires HealingIntent model"
+    )
+HealingIntent = healing_intent.HealingIntent
+
+
+class MockHealingIntent:
+    """Minimal stand-in for HealingIntent"""
+
+    def __init__(self):
+        self.action = "restart_container"
+        self.component = "api-service"
+        self.parameters = {"force": True}
+        self.justification = "High latency detected"
+        self.confidence = 0.85
+        self.incident_id = "inc_123"
+        self.detected_at = time.time()
+        
+    def to_enterprise_request(self):
+        # Built once per instance; callers only read the result
+        request = self.__dict__.get("_enterprise_request")
+        if request is None:
+            request = self._enterprise_request = {
                 "intent_id": "test_intent_123",
                 "action": self.action,
                 "component": self.component,
@@ -31,7 +43,12 @@ def mock_healing_intent():
                 "confidence": self.confidence,
                 "requires_enterprise": True,
             }
-    
+        return request
+
+
+@pytest.fixture
+def mock_healing_intent():
+    """Create a mock HealingIntent for testing"""
     return MockHealingIntent()
 
 
@@ -39,7 +56,7 @@ def mock_healing_intent():
 class TestHealingIntentIntegration:
     """Integration tests for HealingIntent OSS→Enterprise flow"""
     
-    async def test_oss_creates_healing_intent(self):
+    async def test_oss_creates_healing_intent(self, mock_healing_intent):
         """Test that OSS creates HealingIntent properly"""
         from agentic_reliability_framework.engine.mcp_server import MCPServer
         
@@ -58,7 +75,7 @@ class TestHealingIntentIntegration:
         if hasattr(server, 'oss_client') and server.oss_client:
             server.oss_client = AsyncMock()
             server.oss_client.analyze_and_recommend = AsyncMock(
-                return_value=mock_healing_intent()
+                return_value=mock_healing_intent
             )
         
         response = await server.execute_tool(request_dict)
@@ -76,29 +93,23 @@ class TestHealingIntentIntegration:
     
     async def test_enterprise_handoff_ready(self):
         """Test that HealingIntent is ready for Enterprise handoff"""
-        try:
-            from arf_core.models.healing_intent import HealingIntent
-            
-            # Create a HealingIntent
-            intent = HealingIntent(
-                action="rollback",
-                component="database",
-                parameters={"revision": "previous"},
-                justification="Critical error rate detected",
-                confidence=0.9,
-                incident_id="inc_456"
-            )
-            
-            # Convert to Enterprise format
-            enterprise_request = intent.to_enterprise_request()
-            
-            # Verify Enterprise handoff format
-            assert "intent_id" in enterprise_request
-            assert enterprise_request["requires_enterprise"] is True
-            assert enterprise_request["action"] == "rollback"
-            
-        except ImportError:
-            pytest.skip("HealingIntent model not available")
+        # Create a HealingIntent
+        intent = HealingIntent(
+            action="rollback",
+            component="database",
+            parameters={"revision": "previous"},
+            justification="Critical error rate detected",
+            confidence=0.9,
+            incident_id="inc_456"
+        )
+        
+        # Convert to Enterprise format
+        enterprise_request = intent.to_enterprise_request()
+        
+        # Verify Enterprise handoff format
+        assert "intent_id" in enterprise_request
+        assert enterprise_request["requires_enterprise"] is True
+        assert enterprise_request["action"] == "rollback"
     
     async def test_oss_purity_enforcement(self):
         """Test that OSS server enforces purity"""
@@ -4,405 +4,376 @@ Run this in OSS environment only
 """
 
 import json
-import asyncio
-import sys
+import importlib
+import logging
 import os
+import shutil
 from pathlib import Path
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-def test_create_healing_intent():
-    """Create a HealingIntent in OSS and prepare for Enterprise"""
-    print("=" * 60)
-    print("OSS HealingIntent Creation Test")
-    print("=" * 60)
-    
-    try:
-        # Import from your exact structure
-        from arf_core.models.healing_intent import (
-            HealingIntent,
-            IntentSource,
-            IntentStatus,
-            HealingIntentSerializer,
-            create_rollback_intent,
-            create_restart_intent,
-            create_scale_out_intent,
-            create_oss_advisory_intent
-        )
-        
-        # Also import OSS constants to verify
+import pytest
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Progress output goes through logging (lazy %-formatting) so it costs
+# nothing unless a lower level is requested, e.g. --log-level=DEBUG
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.fast_sleep
+
+BANNER = "=" * 60
+
+# Packaged location first, then the legacy top-level arf_core layout
+_HEALING_INTENT_MODULES = (
+    "agentic_reliability_framework.arf_core.models.healing_intent",
+    "arf_core.models.healing_intent",
+)
+
+
+def _resolve_healing_intent_module():
+    """Return the first importable HealingIntent module, or None"""
+    for modpath in _HEALING_INTENT_MODULES:
         try:
-            from arf_core.constants import (
-                OSS_EDITION,
-                OSS_LICENSE,
-                ENTERPRISE_UPGRADE_URL,
-                EXECUTION_ALLOWED
-            )
-            print("✅ Imported OSS constants:")
-            print(f"   Edition: {OSS_EDITION}")
-            print(f"   License: {OSS_LICENSE}")
-            print(f"   Execution allowed: {EXECUTION_ALLOWED}")
+            return importlib.import_module(modpath)
         except ImportError:
-            print("⚠️  Could not import OSS constants, using defaults")
-        
-        print("✅ Imported HealingIntent from arf_core.models.healing_intent")
-        
-        # Test 1: Create rollback intent using factory function
-        print("\n🔧 Test 1: Creating rollback intent...")
-        rollback_intent = create_rollback_intent(
-            component="api-service",
-            revision="previous",
-            justification="High latency spike detected (p99: 450ms vs 200ms SLA)",
-            incident_id="inc_20241220_001",
-            similar_incidents=[
-                {
-                    "incident_id": "inc_20241115_003",
-                    "similarity": 0.85,
-                    "action_taken": "rollback",
-                    "success": True,
-                    "resolution_time_minutes": 2.5
-                }
-            ]
-        )
-        
-        print(f"✅ Created rollback intent:")
-        print(f"   Action: {rollback_intent.action}")
-        print(f"   Component: {rollback_intent.component}")
-        print(f"   Confidence: {rollback_intent.confidence:.2f}")
-        print(f"   OSS Edition: {rollback_intent.oss_edition}")
-        print(f"   Execution allowed: {rollback_intent.execution_allowed}")
-        print(f"   Status: {rollback_intent.status.value}")
-        
-        # Test 2: Verify OSS restrictions
-        print("\n🔒 Test 2: Verifying OSS restrictions...")
-        if rollback_intent.oss_edition != "oss":
-            print(f"❌ ERROR: Expected OSS edition 'oss', got '{rollback_intent.oss_edition}'")
-            return False
-        
-        if rollback_intent.execution_allowed:
-            print("❌ ERROR: OSS intent should not allow execution")
-            return False
-        
-        if rollback_intent.status != IntentStatus.OSS_ADVISORY_ONLY:
-            print(f"❌ ERROR: OSS intent should be OSS_ADVISORY_ONLY, got {rollback_intent.status}")
-            return False
-        
-        print("✅ OSS restrictions verified correctly")
-        
-        # Test 3: Create Enterprise request
-        print("\n📤 Test 3: Creating Enterprise request...")
-        enterprise_request = rollback_intent.to_enterprise_request()
-        
-        required_fields = ["intent_id", "action", "component", "requires_enterprise", "oss_edition"]
-        for field in required_fields:
-            if field not in enterprise_request:
-                print(f"❌ ERROR: Missing required field: {field}")
-                return False
-        
-        print(f"✅ Enterprise request created:")
-        print(f"   Intent ID: {enterprise_request.get('intent_id', 'N/A')}")
-        print(f"   Requires Enterprise: {enterprise_request.get('requires_enterprise', False)}")
-        print(f"   OSS Edition: {enterprise_request.get('oss_edition', 'N/A')}")
-        print(f"   Execution allowed: {enterprise_request.get('execution_allowed', False)}")
-        
-        if not enterprise_request.get("requires_enterprise"):
-            print("❌ ERROR: OSS intent should require Enterprise")
-            return False
-        
-        # Test 4: Serialization to JSON
-        print("\n📄 Test 4: Testing serialization...")
-        
-        # Save to file for handoff
-        output_dir = Path(__file__).parent / "test_outputs"
-        output_dir.mkdir(exist_ok=True)
-        
-        # Enterprise-ready JSON
-        enterprise_json = HealingIntentSerializer.to_enterprise_json(rollback_intent)
-        enterprise_file = output_dir / "healing_intent_for_enterprise.json"
-        with open(enterprise_file, "w") as f:
-            f.write(enterprise_json)
-        
-        # Human-readable version
-        serialized = HealingIntentSerializer.serialize(rollback_intent)
-        human_file = output_dir / "healing_intent_human_readable.json"
-        with open(human_file, "w") as f:
-            json.dump(serialized, f, indent=2)
-        
-        print(f"✅ Files saved:")
-        print(f"   Enterprise JSON: {enterprise_file}")
-        print(f"   Human readable: {human_file}")
-        print(f"   Enterprise JSON size: {len(enterprise_json)} bytes")
-        
-        # Test 5: Verify upgrade information
-        print("\n🔼 Test 5: Checking upgrade information...")
-        if "upgrade_url" not in enterprise_request:
-            print("⚠️  WARNING: Missing upgrade_url in Enterprise request")
-        else:
-            print(f"✅ Upgrade URL: {enterprise_request['upgrade_url']}")
-        
-        if "enterprise_features" in enterprise_request:
-            features = enterprise_request["enterprise_features"]
-            print(f"✅ Enterprise features available: {len(features)} total")
-            if features:
-                print(f"   Sample: {features[0]}, {features[1]}, ...")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"\n❌ Import error: {e}")
-        print("\nAvailable modules in arf_core.models:")
-        print("  - Try: from arf_core.models.healing_intent import HealingIntent")
-        print("  - Check path: agentic_reliability_framework/arf_core/models/healing_intent.py")
-        return False
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def test_mcp_integration():
-    """Test that OSS MCP server correctly uses HealingIntent"""
-    print("\n" + "=" * 60)
-    print("OSS MCP Server Integration Test")
-    print("=" * 60)
-    
-    try:
-        # Import MCP server
-        from agentic_reliability_framework.engine.mcp_server import MCPServer
-        
-        print("✅ Imported OSS MCPServer")
-        
-        # Create server instance
-        server = MCPServer()
-        stats = server.get_server_stats()
-        
-        print(f"\n📊 OSS MCP Server Stats:")
-        print(f"   Edition: {stats.get('edition', 'unknown')}")
-        print(f"   Mode: {stats.get('mode', 'unknown')}")
-        print(f"   Tools registered: {stats.get('registered_tools', 0)}")
-        
-        # Verify OSS restrictions
-        oss_limits = stats.get('oss_limits', {})
-        if oss_limits:
-            print(f"\n🔒 OSS Limits:")
-            print(f"   Execution allowed: {oss_limits.get('execution_allowed', False)}")
-            print(f"   Max incidents: {oss_limits.get('max_incidents', 'unknown')}")
-        
-        # Test that OSS only provides advisory responses
-        print("\n🔍 Testing advisory-only behavior...")
-        
-        request = {
-            "tool": "restart_container",
-            "component": "database-service",
-            "parameters": {"container_id": "db-12345"},
-            "justification": "Test from OSS - should be advisory only",
-            "metadata": {
-                "incident_id": "test_oss_001",
-                "environment": "staging"
-            }
-        }
-        
-        async def make_request():
-            response = await server.execute_tool(request)
-            return response
-        
-        response = asyncio.run(make_request())
-        
-        print(f"📨 MCP Response:")
-        print(f"   Status: {response.get('status')}")
-        print(f"   Executed: {response.get('executed', False)}")
-        print(f"   Message: {response.get('message', '')[:60]}...")
-        
-        # Verify it didn't execute
-        if response.get('executed', False):
-            print("❌ ERROR: OSS executed a tool! Should be advisory only.")
-            return False
-        
-        # Check for Enterprise requirement
-        result = response.get('result', {})
-        if result.get('requires_enterprise'):
-            print("✅ Correctly indicates Enterprise requirement")
-        else:
-            print("⚠️  Missing 'requires_enterprise' flag")
-        
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ MCP test error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def test_healing_intent_from_mcp():
-    """Test backward compatibility with existing MCP requests"""
-    print("\n" + "=" * 60)
-    print("Backward Compatibility Test")
-    print("=" * 60)
-    
-    try:
-        from arf_core.models.healing_intent import HealingIntent
-        
-        # Simulate an MCP request from existing code
-        mcp_request = {
-            "tool": "scale_out",
-            "component": "api-service",
-            "parameters": {"scale_factor": 3},
-            "justification": "High traffic load detected",
-            "timestamp": 1734710400.0,
-            "metadata": {
-                "incident_id": "inc_20241220_003",
-                "environment": "production",
-                "severity": "high",
-                "oss_edition": "oss",
-                "requires_enterprise": True,
-                "execution_allowed": False
+            continue
+    return None
+
+
+# Resolved once at collection time rather than per test
+_HEALING_INTENT_MOD = _resolve_healing_intent_module()
+
+# Status every OSS-created intent must carry, bound once for the assertions
+OSS_ADVISORY_ONLY = (
+    _HEALING_INTENT_MOD.IntentStatus.OSS_ADVISORY_ONLY
+    if _HEALING_INTENT_MOD is not None else None
+)
+
+# Fixed advisory request sent to the MCP server, built once
+_MCP_REQUEST = {
+    "tool": "restart_container",
+    "component": "database-service",
+    "parameters": {"container_id": "db-12345"},
+    "justification": "Test from OSS - should be advisory only",
+    "metadata": {
+        "incident_id": "test_oss_001",
+        "environment": "staging"
+    }
+}
+
+
+@pytest.fixture(scope="session")
+def healing_intent_mod():
+    """HealingIntent module resolved at module load"""
+    if _HEALING_INTENT_MOD is None:
+        pytest.skip("HealingIntent module not available")
+    return _HEALING_INTENT_MOD
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """OSS MCPServer shared by the whole session"""
+    from agentic_reliability_framework.engine.mcp_server import MCPServer
+    return MCPServer()
+
+
+@pytest.fixture(scope="module")
+def rollback_intent(healing_intent_mod):
+    """Rollback intent shared by the creation tests (intents are immutable)"""
+    return healing_intent_mod.create_rollback_intent(
+        component="api-service",
+        revision="previous",
+        justification="High latency spike detected (p99: 450ms vs 200ms SLA)",
+        incident_id="inc_20241220_001",
+        similar_incidents=[
+            {
+                "incident_id": "inc_20241115_003",
+                "similarity": 0.85,
+                "action_taken": "rollback",
+                "success": True,
+                "resolution_time_minutes": 2.5
             }
-        }
-        
-        # Convert to HealingIntent
-        intent = HealingIntent.from_mcp_request(mcp_request)
-        
-        print(f"✅ Created HealingIntent from MCP request:")
-        print(f"   Action: {intent.action}")
-        print(f"   Component: {intent.component}")
-        print(f"   OSS Edition: {intent.oss_edition}")
-        print(f"   Execution allowed: {intent.execution_allowed}")
-        
-        # Verify OSS metadata was preserved
-        if intent.oss_edition != "oss":
-            print("❌ ERROR: OSS edition not preserved")
-            return False
-        
-        if intent.execution_allowed:
-            print("❌ ERROR: Execution should not be allowed")
-            return False
-        
-        # Test serialization
-        serialized = intent.to_dict()
-        print(f"\n📄 Serialization test:")
-        print(f"   Keys in dict: {len(serialized)}")
-        
-        required_keys = ["action", "component", "oss_edition", "requires_enterprise"]
-        for key in required_keys:
-            if key not in serialized:
-                print(f"❌ ERROR: Missing key: {key}")
-                return False
-        
-        print("✅ All required keys present")
-        
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def test_oss_factory_functions():
-    """Test all OSS factory functions"""
-    print("\n" + "=" * 60)
-    print("OSS Factory Functions Test")
-    print("=" * 60)
-    
-    try:
-        from arf_core.models.healing_intent import (
-            create_rollback_intent,
-            create_restart_intent,
-            create_scale_out_intent,
-            create_oss_advisory_intent,
-            IntentStatus
-        )
-        
-        tests = [
-            ("Rollback", lambda: create_rollback_intent("api-service", "previous")),
-            ("Restart", lambda: create_restart_intent("database-service")),
-            ("Scale Out", lambda: create_scale_out_intent("api-service", 3)),
-            ("Generic Advisory", lambda: create_oss_advisory_intent(
-                "circuit_breaker", "payment-service", {"threshold": 0.8},
-                "High error rate detected"
-            ))
         ]
-        
-        all_passed = True
-        for name, factory in tests:
-            intent = factory()
-            
-            # Check OSS properties
-            if intent.oss_edition != "oss":
-                print(f"❌ {name}: Wrong OSS edition: {intent.oss_edition}")
-                all_passed = False
-                continue
-            
-            if intent.execution_allowed:
-                print(f"❌ {name}: Execution should not be allowed")
-                all_passed = False
-                continue
-            
-            if intent.status != IntentStatus.OSS_ADVISORY_ONLY:
-                print(f"❌ {name}: Wrong status: {intent.status}")
-                all_passed = False
-                continue
-            
-            print(f"✅ {name}: OSS advisory intent created correctly")
-            print(f"   Action: {intent.action}, Component: {intent.component}")
-        
-        return all_passed
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-if __name__ == "__main__":
-    print("\n" + "=" * 60)
-    print("OSS → Enterprise Integration Test Suite")
-    print("=" * 60)
-    print("Testing path: arf_core.models.healing_intent")
-    print("=" * 60)
-    
-    tests = [
-        ("HealingIntent Creation", test_create_healing_intent),
-        ("MCP Integration", test_mcp_integration),
-        ("Backward Compatibility", test_healing_intent_from_mcp),
-        ("Factory Functions", test_oss_factory_functions),
-    ]
-    
-    results = []
-    for test_name, test_func in tests:
-        print(f"\n▶️  Running: {test_name}")
-        print("-" * 40)
-        success = test_func()
-        results.append((test_name, success))
-        if not success:
-            print(f"⏹️  Test failed: {test_name}")
-    
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    
-    all_passed = True
-    for test_name, success in results:
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}")
-        if not success:
-            all_passed = False
-    
-    print("\n" + "=" * 60)
-    if all_passed:
-        print("🎉 All OSS tests passed!")
-        print("\nGenerated files in tests/test_outputs/:")
-        print("  • healing_intent_for_enterprise.json - For Enterprise execution")
-        print("  • healing_intent_human_readable.json - For debugging")
-        print("\nNext steps:")
-        print("1. Copy healing_intent_for_enterprise.json to Enterprise repo")
-        print("2. Run Enterprise execution tests")
-        print("3. Verify OSS→Enterprise handoff works")
+    )
+
+
+@pytest.fixture(scope="module")
+def enterprise_request(rollback_intent):
+    """Enterprise request for the shared rollback intent (read-only)"""
+    return rollback_intent.to_enterprise_request()
+
+
+def test_create_healing_intent(healing_intent_mod, rollback_intent):
+    """Create a HealingIntent in OSS and verify OSS restrictions"""
+    logger.debug(BANNER)
+    logger.debug("OSS HealingIntent Creation Test")
+    logger.debug(BANNER)
+
+    logger.debug("✅ Imported OSS constants:")
+    logger.debug("   Edition: %s", healing_intent_mod.OSS_EDITION)
+    logger.debug("   License: %s", healing_intent_mod.OSS_LICENSE)
+    logger.debug("   Execution allowed: %s", healing_intent_mod.EXECUTION_ALLOWED)
+
+    logger.debug("✅ Created rollback intent:")
+    logger.debug("   Action: %s", rollback_intent.action)
+    logger.debug("   Component: %s", rollback_intent.component)
+    logger.debug("   Confidence: %.2f", rollback_intent.confidence)
+    logger.debug("   OSS Edition: %s", rollback_intent.oss_edition)
+    logger.debug("   Execution allowed: %s", rollback_intent.execution_allowed)
+    logger.debug("   Status: %s", rollback_intent.status.value)
+
+    # Literal, not the module constant, so a changed edition string is caught
+    assert rollback_intent.oss_edition == "open-source", \
+        f"Expected OSS edition 'open-source', got '{rollback_intent.oss_edition}'"
+    assert not rollback_intent.execution_allowed, "OSS intent should not allow execution"
+    assert rollback_intent.status == OSS_ADVISORY_ONLY, \
+        f"OSS intent should be OSS_ADVISORY_ONLY, got {rollback_intent.status}"
+
+    logger.debug("✅ OSS restrictions verified correctly")
+
+
+def test_enterprise_request(enterprise_request):
+    """Test the Enterprise request carries the handoff fields"""
+    required_fields = ["intent_id", "action", "component", "requires_enterprise", "oss_edition"]
+    missing = [field for field in required_fields if field not in enterprise_request]
+    assert not missing, f"Missing required fields: {missing}"
+
+    logger.debug("✅ Enterprise request created:")
+    logger.debug("   Intent ID: %s", enterprise_request.get('intent_id', 'N/A'))
+    logger.debug("   Requires Enterprise: %s", enterprise_request.get('requires_enterprise', False))
+    logger.debug("   OSS Edition: %s", enterprise_request.get('oss_edition', 'N/A'))
+    logger.debug("   Execution allowed: %s", enterprise_request.get('execution_allowed', False))
+
+    assert enterprise_request.get("requires_enterprise"), "OSS intent should require Enterprise"
+
+
+def test_serialization(healing_intent_mod, rollback_intent, tmp_path):
+    """Test the Enterprise handoff files can be written"""
+    HealingIntentSerializer = healing_intent_mod.HealingIntentSerializer
+
+    # Write into the per-test temp dir; see ARF_EMIT_HANDOFF below
+    output_dir = tmp_path
+
+    # Enterprise-ready JSON
+    enterprise_json = HealingIntentSerializer.to_enterprise_json_bytes(rollback_intent)
+    enterprise_file = output_dir / "healing_intent_for_enterprise.json"
+    enterprise_file.write_bytes(enterprise_json)
+
+    # Human-readable version
+    human_file = output_dir / "healing_intent_human_readable.json"
+    human_file.write_bytes(HealingIntentSerializer.to_json_bytes(rollback_intent, pretty=True))
+
+    # Binary sibling for Enterprise consumers that accept MessagePack
+    handoff_files = [enterprise_file, human_file]
+    if msgpack is not None:
+        enterprise_msgpack = HealingIntentSerializer.to_enterprise_msgpack(rollback_intent)
+        assert msgpack.unpackb(enterprise_msgpack, raw=False) == json.loads(enterprise_json)
+        framed = HealingIntentSerializer.to_enterprise_msgpack(rollback_intent, framed=True)
+        assert int.from_bytes(framed[:4], "big") == len(framed) - 4
+        msgpack_file = output_dir / "healing_intent_for_enterprise.msgpack"
+        msgpack_file.write_bytes(enterprise_msgpack)
+        handoff_files.append(msgpack_file)
+        logger.debug("   Enterprise MessagePack size: %s bytes", len(enterprise_msgpack))
+
+    # Keep a copy for the Enterprise handoff only when asked to
+    if os.environ.get("ARF_EMIT_HANDOFF"):
+        handoff_dir = Path(__file__).parent / "test_outputs"
+        handoff_dir.mkdir(exist_ok=True)
+        handoff_files = [Path(shutil.copy(path, handoff_dir)) for path in handoff_files]
+        enterprise_file, human_file = handoff_files[:2]
+
+    logger.debug("✅ Files saved:")
+    logger.debug("   Enterprise JSON: %s", enterprise_file)
+    logger.debug("   Human readable: %s", human_file)
+    logger.debug("   Enterprise JSON size: %s bytes", len(enterprise_json))
+
+
+def _encode_intent(serializer, intent, pretty):
+    """Decoded public JSON outputs of one intent (minus the clock-derived fields)"""
+    enterprise = serializer.to_enterprise_json_bytes(intent)
+    full = serializer.to_json(intent, pretty=pretty).encode()
+    assert "über".encode() in enterprise and "über".encode() in full  # raw UTF-8
+    decoded = json.loads(full)
+    del decoded["metadata"]["serialized_at"]
+    del decoded["data"]["age_seconds"]
+    return json.loads(enterprise), decoded
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_output_independent_of_orjson(healing_intent_mod, monkeypatch, pretty):
+    """The orjson and stdlib encoders produce the same JSON for one intent"""
+    pytest.importorskip("orjson")
+    HealingIntentSerializer = healing_intent_mod.HealingIntentSerializer
+    intent = healing_intent_mod.HealingIntent(
+        action="restart",
+        component="api-service",
+        parameters={"max_bytes": 1e16, "tiny": 2.5e-12, "label": "Latenz über SLA — p99"},
+        justification="Latenz über SLA — p99 450ms",
+    )
+
+    with_orjson = _encode_intent(HealingIntentSerializer, intent, pretty)
+    monkeypatch.setattr(healing_intent_mod, "orjson", None)
+    with_stdlib = _encode_intent(HealingIntentSerializer, intent, pretty)
+
+    # Same values; only float spelling may differ (1e16 vs 1e+16)
+    assert with_stdlib == with_orjson
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_json_output_rejects_non_finite_floats(healing_intent_mod, monkeypatch, use_orjson, value):
+    """NaN/Infinity are not JSON: both encoders refuse them instead of writing null or NaN"""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(healing_intent_mod, "orjson", None)
+    HealingIntentSerializer = healing_intent_mod.HealingIntentSerializer
+    intent = healing_intent_mod.HealingIntent(
+        action="restart",
+        component="api-service",
+        parameters={"threshold": value},
+    )
+
+    with pytest.raises(healing_intent_mod.SerializationError):
+        HealingIntentSerializer.to_enterprise_json_bytes(intent)
+    with pytest.raises(healing_intent_mod.SerializationError):
+        HealingIntentSerializer.to_json(intent)
+
+
+def test_upgrade_info(enterprise_request):
+    """Test the Enterprise request advertises upgrade information"""
+    if "upgrade_url" not in enterprise_request:
+        logger.warning("⚠️  Missing upgrade_url in Enterprise request")
+    else:
+        logger.debug("✅ Upgrade URL: %s", enterprise_request['upgrade_url'])
+
+    if "enterprise_features" in enterprise_request:
+        features = enterprise_request["enterprise_features"]
+        logger.debug("✅ Enterprise features available: %s total", len(features))
+        # One joined record for the preview, built only when DEBUG is on
+        if features and logger.isEnabledFor(logging.DEBUG):
+            preview = "\n     • ".join(map(str, features[:3]))
+            if len(features) > 3:
+                preview += f"\n     • ... and {len(features) - 3} more"
+            logger.debug("   Sample:\n     • %s", preview)
+
+
+@pytest.mark.asyncio
+async def test_mcp_integration(mcp_server):
+    """Test that OSS MCP server correctly uses HealingIntent"""
+    logger.debug(BANNER)
+    logger.debug("OSS MCP Server Integration Test")
+    logger.debug(BANNER)
+
+    stats = mcp_server.get_server_stats()
+
+    logger.debug("📊 OSS MCP Server Stats:")
+    logger.debug("   Edition: %s", stats.get('edition', 'unknown'))
+    logger.debug("   Mode: %s", stats.get('mode', 'unknown'))
+    logger.debug("   Tools registered: %s", stats.get('registered_tools', 0))
+
+    # Verify OSS restrictions
+    oss_limits = stats.get('oss_limits', {})
+    if oss_limits:
+        logger.debug("🔒 OSS Limits:")
+        logger.debug("   Execution allowed: %s", oss_limits.get('execution_allowed', False))
+        logger.debug("   Max incidents: %s", oss_limits.get('max_incidents', 'unknown'))
+
+    # Test that OSS only provides advisory responses
+    logger.debug("🔍 Testing advisory-only behavior...")
+
+    # execute_tool() writes "mode" into the dict it is given, so pass a copy
+    response = await mcp_server.execute_tool(dict(_MCP_REQUEST))
+
+    logger.debug("📨 MCP Response:")
+    logger.debug("   Status: %s", response.status.value)
+    logger.debug("   Executed: %s", response.executed)
+    logger.debug("   Message: %s...", response.message[:60])
+
+    # Verify it didn't execute
+    assert not response.executed, "OSS executed a tool! Should be advisory only."
+
+    # Check for Enterprise requirement
+    result = response.result or {}
+    if result.get('requires_enterprise'):
+        logger.debug("✅ Correctly indicates Enterprise requirement")
     else:
-        print("❌ Some tests failed. Check OSS implementation.")
-    
-    print("=" * 60)
-    
-    # Exit with appropriate code for CI
-    sys.exit(0 if all_passed else 1)
+        logger.warning("⚠️  Missing 'requires_enterprise' flag")
+
+
+def test_healing_intent_from_mcp(healing_intent_mod):
+    """Test backward compatibility with existing MCP requests"""
+    logger.debug(BANNER)
+    logger.debug("Backward Compatibility Test")
+    logger.debug(BANNER)
+
+    # Simulate an MCP request from existing code
+    mcp_request = {
+        "tool": "scale_out",
+        "component": "api-service",
+        "parameters": {"scale_factor": 3},
+        "justification": "High traffic load detected",
+        "timestamp": 1734710400.0,
+        "metadata": {
+            "incident_id": "inc_20241220_003",
+            "environment": "production",
+            "severity": "high",
+            "oss_edition": "oss",
+            "requires_enterprise": True,
+            "execution_allowed": False
+        }
+    }
+
+    # Convert to HealingIntent
+    intent = healing_intent_mod.HealingIntent.from_mcp_request(mcp_request)
+
+    logger.debug("✅ Created HealingIntent from MCP request:")
+    logger.debug("   Action: %s", intent.action)
+    logger.debug("   Component: %s", intent.component)
+    logger.debug("   OSS Edition: %s", intent.oss_edition)
+    logger.debug("   Execution allowed: %s", intent.execution_allowed)
+
+    # Verify OSS metadata was preserved
+    assert intent.oss_edition == mcp_request["metadata"]["oss_edition"], "OSS edition not preserved"
+    assert not intent.execution_allowed, "Execution should not be allowed"
+
+    # Test serialization
+    serialized = intent.to_dict()
+    logger.debug("📄 Serialization test:")
+    logger.debug("   Keys in dict: %s", len(serialized))
+
+    required_keys = ["action", "component", "oss_edition", "requires_enterprise"]
+    missing = [key for key in required_keys if key not in serialized]
+    assert not missing, f"Missing keys: {missing}"
+
+    logger.debug("✅ All required keys present")
+
+
+# (name, factory) pairs; each factory takes the HealingIntent module
+_OSS_FACTORIES = [
+    ("Rollback", lambda m: m.create_rollback_intent("api-service", "previous")),
+    ("Restart", lambda m: m.create_restart_intent("database-service")),
+    ("Scale Out", lambda m: m.create_scale_out_intent("api-service", 3)),
+    ("Generic Advisory", lambda m: m.create_oss_advisory_intent(
+        "circuit_breaker", "payment-service", {"threshold": 0.8},
+        "High error rate detected"
+    )),
+]
+
+
+@pytest.mark.parametrize("name,factory", _OSS_FACTORIES, ids=[n for n, _ in _OSS_FACTORIES])
+def test_oss_factory_functions(healing_intent_mod, name, factory):
+    """Test each OSS factory function creates an advisory-only intent"""
+    intent = factory(healing_intent_mod)
+
+    # Check OSS properties
+    assert intent.oss_edition == "open-source", \
+        f"{name}: Wrong OSS edition: {intent.oss_edition}"
+    assert not intent.execution_allowed, f"{name}: Execution should not be allowed"
+    assert intent.status == OSS_ADVISORY_ONLY, \
+        f"{name}: Wrong status: {intent.status}"
+
+    logger.debug("✅ %s: OSS advisory intent created correctly", name)
+    logger.debug("   Action: %s, Component: %s", intent.action, intent.component)
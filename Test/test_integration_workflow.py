@@ -4,22 +4,19 @@ Integration test for the complete ARF OSS workflow.
 """
 
 import pytest
-import asyncio
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 
 @pytest.mark.integration
 @pytest.mark.slow
 class TestCompleteOSSWorkflow:
     """Test the complete OSS workflow from event detection to healing intent."""
     
+    @pytest.mark.asyncio
+    @pytest.mark.fresh_imports
     async def test_event_to_intent_workflow(self):
         """Test complete flow: event → detection → recall → decision → intent"""
-        # Clear modules for clean test
-        from test_utils import clear_arf_modules
-        clear_arf_modules()
+        from datetime import datetime
         
-        # Import after clearing
+        # Modules are cleared by the fresh_imports marker (see conftest)
         from agentic_reliability_framework.arf_core.models import (
             create_compatible_event,
             EventSeverity,
@@ -74,8 +71,6 @@ class TestCompleteOSSWorkflow:
         assert result["status"] in ["advisory", "requires_enterprise"]
         assert result["executed"] == False
         assert "oss_edition" in result
-        
-        return True
     
     def test_policy_evaluation_integration(self):
         """Test policy evaluation with mock memory"""
@@ -88,11 +83,3 @@ class TestCompleteOSSWorkflow:
         # This would test timeline and cost calculations
         # For now, create a placeholder test
         assert True  # Will be implemented in next phase
-
-
-@pytest.fixture(scope="module")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
@@ -6,6 +6,8 @@ import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 
+pytestmark = pytest.mark.fast_sleep
+
 
 @pytest.fixture
 def oss_server():
@@ -264,9 +264,8 @@ class TestEventImmutability:
         assert event1.severity == EventSeverity.LOW
         # Copy updated
         assert event2.severity == EventSeverity.HIGH
-        # Other fields same
-        assert event2.component == event1.component
-        assert event2.latency_p99 == event1.latency_p99
+        # Other fields same (one comparison, one diff on failure)
+        assert event2.model_dump(exclude={'severity'}) == event1.model_dump(exclude={'severity'})
 
 
 class TestDependencyValidation:
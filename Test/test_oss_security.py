@@ -3,64 +3,94 @@ OSS Security Validation Tests
 Tests that OSS components are secure and cannot bypass enterprise boundaries.
 """
 
+import asyncio
+import importlib
 import pytest
 import sys
-import os
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
-# Add path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_OSS_PACKAGE = "agentic_reliability_framework"
 
-try:
-    from src.agentic_reliability_framework import HealingIntent, OSSMCPClient
-    from src.agentic_reliability_framework.models import Action, ConfidenceScore
-    OSS_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️  Cannot import OSS: {e}")
-    OSS_AVAILABLE = False
+# Names that would let OSS code skip Enterprise execution gates
+_DANGEROUS_METHODS = frozenset({
+    'execute_without_gates',
+    'bypass_security',
+    'force_enterprise_action',
+    'override_license_check',
+})
+
+# Enterprise-only constants that must not be exposed by the OSS package
+_ENTERPRISE_CONSTANTS = frozenset({'ENTERPRISE_FEATURES', 'EXECUTION_GATES'})
+
+
+def _load_oss_symbols():
+    """Import the OSS names these tests exercise (raises ImportError if absent)."""
+    arf = importlib.import_module(_OSS_PACKAGE)
+    return SimpleNamespace(
+        arf=arf,
+        HealingIntent=arf.HealingIntent,
+        OSSMCPClient=arf.OSSMCPClient,
+        intent_factories=(
+            arf.create_rollback_intent,
+            arf.create_restart_intent,
+            arf.create_scale_out_intent,
+        ),
+    )
+
+
+@pytest.fixture(scope="class")
+def oss_symbols():
+    """OSS package and models, imported once per test class."""
+    pytest.importorskip(_OSS_PACKAGE, reason="OSS not available")
+    try:
+        return _load_oss_symbols()
+    except (ImportError, AttributeError) as e:
+        pytest.skip(f"OSS not available: {e}")
 
 
-@pytest.mark.skipif(not OSS_AVAILABLE, reason="OSS not available")
 class TestOSSSecurityBoundaries:
     """Test that OSS cannot bypass enterprise security boundaries."""
     
-    def test_healing_intent_cannot_force_execution(self):
+    def test_healing_intent_cannot_force_execution(self, oss_symbols):
         """Test HealingIntent cannot bypass execution gates."""
         print("🔒 Testing: HealingIntent execution boundaries")
         
         # Create healing intent with high confidence
-        intent = HealingIntent(
-            action_description="Fix database corruption",
-            rationale="Automated repair needed",
-            confidence_score=0.95,
-            evidence={"previous_success": True}
+        intent = oss_symbols.HealingIntent(
+            action="restart",
+            component="database",
+            justification="Automated repair needed",
+            confidence=0.95,
         )
         
         # Should require validation even with high confidence
         assert not hasattr(intent, 'bypass_gates'), "HealingIntent should not have bypass capabilities"
         assert not hasattr(intent, 'force_execute'), "Should not have force execution"
+        assert intent.execution_allowed is False, "OSS intents must not allow execution"
         
         print("  ✅ HealingIntent respects execution boundaries")
     
-    def test_oss_mcp_client_security(self):
+    async def test_oss_mcp_client_security(self, oss_symbols):
         """Test OSS MCP client cannot bypass security."""
         print("🔒 Testing: OSS MCP client security")
         
-        # Mock MCP server with security restrictions
-        mock_server = Mock()
-        mock_server.require_authentication = True
-        mock_server.allowed_actions = ["read", "query"]
-        mock_server.blocked_actions = ["execute", "delete", "modify"]
-        
         # Create OSS client
-        client = OSSMCPClient(server_config={"url": "test://localhost"})
+        client = oss_symbols.OSSMCPClient(config={"url": "test://localhost"})
+        assert client.mode == "advisory", f"OSS MCP client must be advisory, got {client.mode}"
         
-        # Should validate server security
-        assert hasattr(client, 'validate_server_security'), "MCP client should validate security"
+        # Even an explicit tool request is only analysed, never executed
+        result = await client.execute_tool({
+            "tool": "restart_container",
+            "component": "database",
+            "parameters": {},
+            "justification": "Security test",
+        })
+        assert result["executed"] is False, "OSS MCP client must not execute tools"
+        assert result["execution_allowed"] is False, "OSS MCP client must not allow execution"
         
-        print("  ✅ OSS MCP client has security validation")
+        print("  ✅ OSS MCP client is advisory only")
     
-    def test_confidence_score_limits(self):
+    def test_confidence_score_limits(self, oss_symbols):
         """Test OSS confidence scores have execution limits."""
         print("🔒 Testing: Confidence score execution limits")
         
@@ -72,23 +102,23 @@ class TestOSSSecurityBoundaries:
         ]
         
         for score, should_execute, description in test_cases:
-            confidence = ConfidenceScore(
-                value=score,
-                rationale="Test confidence",
-                evidence_quality="medium"
+            intent = oss_symbols.HealingIntent(
+                action="restart",
+                component="api",
+                justification="Test confidence",
+                confidence=score,
             )
             
             # OSS confidence alone should never allow automatic execution
             # Execution should always go through enterprise gates
+            assert intent.execution_allowed is should_execute, description
+            assert intent.requires_enterprise, description
             print(f"  ✅ {description}: score={score}")
     
-    def test_no_direct_database_access(self):
+    def test_no_direct_database_access(self, oss_symbols):
         """Test OSS cannot access databases directly."""
         print("🔒 Testing: No direct database access")
         
-        # Check imports
-        import src.agentic_reliability_framework as arf
-        
         # OSS should not have direct database connectors
         forbidden_modules = [
             "psycopg2",  # PostgreSQL
@@ -109,77 +139,60 @@ class TestOSSSecurityBoundaries:
         
         print("  ✅ OSS doesn't have direct database access")
     
-    def test_action_validation_required(self):
+    def test_action_validation_required(self, oss_symbols):
         """Test all actions require validation."""
         print("🔒 Testing: Action validation requirements")
         
-        from src.agentic_reliability_framework.models import Action
-        
-        # Create various action types
-        actions = [
-            Action(type="database_query", payload={"query": "SELECT * FROM users"}),
-            Action(type="api_call", payload={"endpoint": "/api/users", "method": "GET"}),
-            Action(type="file_operation", payload={"path": "/tmp/test.txt", "operation": "read"}),
-        ]
+        # Create every OSS action type
+        actions = [factory(component="api-service") for factory in oss_symbols.intent_factories]
         
         for action in actions:
-            # All actions should require validation
-            assert hasattr(action, 'requires_validation'), f"Action {action.type} should require validation"
-            assert action.requires_validation, f"Action {action.type} validation should be required"
+            # All actions should require Enterprise validation before execution
+            assert action.requires_enterprise, f"Action {action.action} should require validation"
+            assert action.execution_allowed is False, f"Action {action.action} must not be executable in OSS"
             
-            print(f"  ✅ {action.type} requires validation")
+            print(f"  ✅ {action.action} requires validation")
 
 
-@pytest.mark.skipif(not OSS_AVAILABLE, reason="OSS not available")
 class TestOSSEnterpriseIntegrationSecurity:
     """Test security of OSS-Enterprise integration."""
     
-    def test_cannot_bypass_enterprise_gates(self):
+    def test_cannot_bypass_enterprise_gates(self, oss_symbols):
         """Test OSS cannot bypass enterprise execution gates."""
         print("🔒 Testing: Cannot bypass enterprise gates")
         
         # Simulate OSS trying to execute directly
         try:
             # Try to import enterprise bypass methods (should not exist)
-            import src.agentic_reliability_framework as arf
-            
-            # Check for dangerous methods
-            dangerous_methods = [
-                'execute_without_gates',
-                'bypass_security',
-                'force_enterprise_action',
-                'override_license_check'
-            ]
+            arf = oss_symbols.arf
             
-            for method in dangerous_methods:
-                assert not hasattr(arf, method), f"Dangerous method {method} should not exist in OSS"
+            # hasattr, not dir(): __dir__ only lists globals and __all__, while hasattr
+            # also catches names __getattr__ would serve without declaring them
+            leaked = {name for name in _DANGEROUS_METHODS if hasattr(arf, name)}
+            assert not leaked, f"Dangerous methods {sorted(leaked)} should not exist in OSS"
             
             print("  ✅ No bypass methods in OSS")
             
         except Exception as e:
             print(f"  ✅ Security check passed: {e}")
     
-    def test_enterprise_boundary_enforcement(self):
+    def test_enterprise_boundary_enforcement(self, oss_symbols):
         """Test enterprise boundaries are enforced."""
         print("🔒 Testing: Enterprise boundary enforcement")
         
-        # Mock enterprise boundary check
-        with patch('src.agentic_reliability_framework._enterprise_boundary') as mock_boundary:
-            mock_boundary.return_value = False  # Not enterprise
-            
-            # Try to access enterprise features
-            try:
-                import arf_enterprise
-                print("  ⚠️  Enterprise imported - verify licensing")
-            except ImportError:
-                print("  ✅ Enterprise correctly not importable from OSS")
-            
-            # Check OSS doesn't have enterprise constants
-            import src.agentic_reliability_framework as arf
-            assert not hasattr(arf, 'ENTERPRISE_FEATURES'), "OSS should not have enterprise constants"
-            assert not hasattr(arf, 'EXECUTION_GATES'), "OSS should not have execution gates"
-            
-            print("  ✅ Enterprise boundaries enforced")
+        # Try to access enterprise features
+        try:
+            import arf_enterprise
+            print("  ⚠️  Enterprise imported - verify licensing")
+        except ImportError:
+            print("  ✅ Enterprise correctly not importable from OSS")
+        
+        # Check OSS doesn't have enterprise constants
+        arf = oss_symbols.arf
+        leaked = {name for name in _ENTERPRISE_CONSTANTS if hasattr(arf, name)}
+        assert not leaked, f"OSS should not have enterprise constants/execution gates: {sorted(leaked)}"
+        
+        print("  ✅ Enterprise boundaries enforced")
 
 
 def run_oss_security_validation():
@@ -197,18 +210,26 @@ def run_oss_security_validation():
         "passed": []
     }
     
+    try:
+        symbols = _load_oss_symbols()
+    except (ImportError, AttributeError) as e:
+        print(f"⚠️  Cannot import OSS: {e}")
+        symbols = None
+    
     # Run boundary tests
-    if OSS_AVAILABLE:
+    if symbols is not None:
         print("\n🔍 Testing OSS Security Boundaries...")
         
+        boundaries = TestOSSSecurityBoundaries()
+        integration = TestOSSEnterpriseIntegrationSecurity()
         test_cases = [
-            ("HealingIntent boundaries", TestOSSSecurityBoundaries().test_healing_intent_cannot_force_execution),
-            ("MCP client security", TestOSSSecurityBoundaries().test_oss_mcp_client_security),
-            ("Confidence score limits", TestOSSSecurityBoundaries().test_confidence_score_limits),
-            ("Database access", TestOSSSecurityBoundaries().test_no_direct_database_access),
-            ("Action validation", TestOSSSecurityBoundaries().test_action_validation_required),
-            ("Enterprise bypass", TestOSSEnterpriseIntegrationSecurity().test_cannot_bypass_enterprise_gates),
-            ("Boundary enforcement", TestOSSEnterpriseIntegrationSecurity().test_enterprise_boundary_enforcement),
+            ("HealingIntent boundaries", lambda: boundaries.test_healing_intent_cannot_force_execution(symbols)),
+            ("MCP client security", lambda: asyncio.run(boundaries.test_oss_mcp_client_security(symbols))),
+            ("Confidence score limits", lambda: boundaries.test_confidence_score_limits(symbols)),
+            ("Database access", lambda: boundaries.test_no_direct_database_access(symbols)),
+            ("Action validation", lambda: boundaries.test_action_validation_required(symbols)),
+            ("Enterprise bypass", lambda: integration.test_cannot_bypass_enterprise_gates(symbols)),
+            ("Boundary enforcement", lambda: integration.test_enterprise_boundary_enforcement(symbols)),
         ]
         
         for test_name, test_method in test_cases:
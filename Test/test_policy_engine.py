@@ -19,16 +19,18 @@ class TestPolicyEngineBasics:
         assert len(policy_engine.policies) > 0
         assert policy_engine.max_cooldown_history == 100
     
-    def test_policy_evaluation_no_match(self, policy_engine, normal_event):
-        """Test that normal events don't trigger policies"""
-        actions = policy_engine.evaluate_policies(normal_event)
-        assert actions == [HealingAction.NO_ACTION]
-    
-    def test_policy_evaluation_match(self, policy_engine, critical_event):
-        """Test that critical events trigger policies"""
-        actions = policy_engine.evaluate_policies(critical_event)
-        assert len(actions) > 0
-        assert HealingAction.NO_ACTION not in actions
+    @pytest.mark.parametrize("variant,should_trigger", [
+        ("normal", False),
+        ("critical", True),
+    ])
+    def test_policy_evaluation(self, policy_engine, event_variant, variant, should_trigger):
+        """Test that critical events trigger policies and normal events don't"""
+        actions = policy_engine.evaluate_policies(event_variant(variant))
+        if should_trigger:
+            assert len(actions) > 0
+            assert HealingAction.NO_ACTION not in actions
+        else:
+            assert actions == [HealingAction.NO_ACTION]
     
     def test_policy_disabled(self, sample_policy, sample_event):
         """Test that disabled policies don't execute"""
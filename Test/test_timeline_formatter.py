@@ -13,12 +13,6 @@ import pytest
 class TestTimelineFormatter:
     """Test suite for TimelineFormatter class"""
     
-    @pytest.fixture
-    def sample_metrics(self):
-        """Create sample TimelineMetrics for testing"""
-        # TODO: Create TimelineMetrics instance with known values
-        pass
-    
     def test_format_markdown_comparison(self, sample_metrics):
         """Test markdown comparison formatting"""
         # TODO: Generate markdown and verify structure
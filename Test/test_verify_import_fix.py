@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Quick verification that imports work after circular dependency fixes.
+Enhanced version with more comprehensive checks and OSS boundary validation.
+
+This script now includes:
+1. Comprehensive import tests for all OSS components
+2. OSS boundary validation
+3. Circular import detection
+4. Import structure verification
+
+The checks are pytest tests and run with the rest of the suite; to run
+only these:
+
+    pytest Test/test_verify_import_fix.py -x -n auto
+
+or execute this file directly, which does the same (in parallel when
+pytest-xdist is installed).
+"""
+
+import sys
+import functools
+import importlib
+import importlib.util
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+
+# Add parent directory to path for testing (once, even if re-imported)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+# Budget for any single ARF submodule in a cold `-X importtime` trace
+_MAX_MODULE_IMPORT_US = 200_000
+
+# Public OSS boundary constants and the values the OSS edition must ship
+_EXPECTED_OSS = {
+    "OSS_EDITION": "open-source",
+    "OSS_LICENSE": "Apache 2.0",
+    "EXECUTION_ALLOWED": False,
+    "MCP_MODES_ALLOWED": ("advisory",),
+}
+
+
+
+def _drop(prefix: str, deny: Tuple[str, ...] = ("test",)) -> List[str]:
+    """Remove cached modules under prefix (skipping names containing deny)"""
+    names = [
+        n for n in list(sys.modules)
+        if n.startswith(prefix) and not any(d in n for d in deny)
+    ]
+    for name in names:
+        sys.modules.pop(name, None)
+    return names
+
+
+@pytest.fixture
+def fresh_arf():
+    """Drop every cached ARF module, then import the package from scratch"""
+    _drop("agentic_reliability_framework")
+    import agentic_reliability_framework as arf
+    yield arf
+
+
+def _suite(name: str, module: str, attrs: Tuple[str, ...]):
+    """One SUITES row"""
+    return pytest.param(module, attrs, id=f"{name}:{module}")
+
+
+# (suite, module path, names it must expose)
+SUITES = [
+    _suite("basic", "agentic_reliability_framework",
+           ("HealingIntent", "OSSMCPClient", "EngineFactory", "OSS_EDITION")),
+    _suite("basic", "agentic_reliability_framework.memory", ("EnhancedFAISSIndex",)),
+    _suite("basic", "agentic_reliability_framework.config", ("Config", "config")),
+    _suite("arf_core", "agentic_reliability_framework.arf_core",
+           ("HealingIntent", "OSSMCPClient", "create_mcp_client", "OSSBoundaryError")),
+    _suite("models", "agentic_reliability_framework.arf_core.models",
+           ("HealingIntent", "create_rollback_intent", "EventSeverity",
+            "ReliabilityEvent", "create_compatible_event")),
+    _suite("models", "agentic_reliability_framework.models",
+           ("ReliabilityEvent", "HealingPolicy", "PolicyCondition",
+            "AnomalyResult", "ForecastResult")),
+    _suite("engine", "agentic_reliability_framework.engine",
+           ("EnhancedReliabilityEngine", "AdvancedAnomalyDetector",
+            "BusinessMetricsTracker", "SimplePredictiveEngine",
+            "V3ReliabilityEngine", "MCPServer", "EngineFactory")),
+]
+
+
+@pytest.mark.parametrize("module_path,attrs", SUITES)
+def test_suite_exports(fresh_arf, module_path, attrs):
+    """Each module imports without circular dependencies and exposes its names"""
+    module = importlib.import_module(module_path)
+    missing = [attr for attr in attrs if not hasattr(module, attr)]
+    assert not missing, f"{module_path} does not provide: {missing}"
+
+
+@pytest.mark.smoke
+def test_create_compatible_event_smoke():
+    """ReliabilityEvent creation works without circular imports"""
+    from agentic_reliability_framework.arf_core.models import (
+        EventSeverity,
+        create_compatible_event,
+    )
+
+    event = create_compatible_event(
+        component="test",
+        severity=EventSeverity.MEDIUM,
+        latency_p99=100.0
+    )
+    assert event.component == "test"
+
+
+@pytest.mark.smoke
+def test_create_rollback_intent_smoke():
+    """Model creation works without circular imports"""
+    from agentic_reliability_framework.arf_core.models import create_rollback_intent
+
+    intent = create_rollback_intent(
+        component="api",
+        revision="v1.0.0",
+        justification="Test"
+    )
+    assert intent.component == "api"
+
+
+def test_oss_boundary():
+    """Test OSS/Enterprise boundary"""
+    print("\nTesting OSS boundary...")
+
+    from agentic_reliability_framework import OSS_EDITION, OSS_LICENSE
+    print(f"✓ OSS constants: edition={OSS_EDITION}, license={OSS_LICENSE}")
+
+    from agentic_reliability_framework.arf_core.constants import (
+        OSSBoundaryError,
+        validate_oss_config,
+    )
+    print("✓ OSS boundary utilities")
+
+    # An advisory-only config is within the OSS boundary
+    validate_oss_config({
+        "mcp_mode": "advisory",
+        "max_events_stored": 1000,
+        "graph_storage": "in_memory",
+    })
+    print("✓ OSS config validation")
+
+    with pytest.raises(OSSBoundaryError):
+        validate_oss_config({"mcp_mode": "autonomous"})
+
+
+def test_complete_workflow(fresh_arf):
+    """Test a complete import workflow"""
+    print("\nTesting complete import workflow...")
+
+    # Import in user order
+    arf = fresh_arf
+
+    # Check version
+    assert hasattr(arf, '__version__'), "No __version__ found"
+    print(f"✓ Package version: {arf.__version__}")
+
+    # Check OSS mode
+    assert arf.OSS_EDITION == _EXPECTED_OSS["OSS_EDITION"], "Should be OSS edition"
+    print("✓ OSS edition confirmed")
+
+    # Import key components
+    from agentic_reliability_framework import (
+        HealingIntent,
+        create_mcp_client,
+        get_oss_capabilities,
+    )
+
+    # Get capabilities
+    caps = get_oss_capabilities()
+    print(f"✓ OSS capabilities: {caps.get('mode', 'unknown')}")
+
+
+def test_oss_import_structure(fresh_arf):
+    """Test comprehensive OSS import structure"""
+    print("\nTesting OSS import structure...")
+
+    # Public API reachable from the one package import: (label, names)
+    # Dotted names walk submodule attributes from the package.
+    imports_to_test = [
+        ("HealingIntent", ["HealingIntent"]),
+        ("HealingIntentSerializer", ["HealingIntentSerializer"]),
+        ("OSSMCPClient", ["OSSMCPClient"]),
+        ("create_mcp_client", ["create_mcp_client"]),
+        ("OSS Constants", ["OSS_EDITION", "OSS_LICENSE", "EXECUTION_ALLOWED", "MCP_MODES_ALLOWED"]),
+        ("Factory Functions", ["create_rollback_intent", "create_restart_intent", "create_scale_out_intent"]),
+        ("Core Models", ["ReliabilityEvent", "EventSeverity", "create_compatible_event"]),
+        ("Engine Factory", ["EngineFactory", "create_engine", "get_engine", "get_oss_engine_capabilities"]),
+        ("OSS Response Types", ["OSSMCPResponse", "OSSAnalysisResult"]),
+        ("OSS Validation", ["OSSBoundaryError", "validate_oss_config", "get_oss_capabilities", "check_oss_compliance"]),
+    ]
+
+    passed_imports = 0
+    failed_imports = []
+
+    for name, attrs in imports_to_test:
+        try:
+            for attr in attrs:
+                functools.reduce(getattr, attr.split("."), fresh_arf)
+            print(f"✓ {name}")
+            passed_imports += 1
+        except RecursionError as e:
+            print(f"✗ {name}: CIRCULAR IMPORT DETECTED: {e}")
+            failed_imports.append(f"{name}: Circular import")
+        except Exception as e:
+            print(f"✗ {name}: {type(e).__name__}: {e}")
+            failed_imports.append(f"{name}: {type(e).__name__}: {e}")
+
+    # Verify OSS edition constraints
+    actual = {name: getattr(fresh_arf, name) for name in _EXPECTED_OSS}
+    assert actual == _EXPECTED_OSS, f"OSS boundary mismatch: {actual} != {_EXPECTED_OSS}"
+
+    print(f"✓ OSS boundary constraints verified")
+
+    # Test that OSSMCPClient is advisory only
+    from agentic_reliability_framework import OSSMCPClient
+    client = OSSMCPClient()
+    assert hasattr(client, 'mode'), "OSSMCPClient should have 'mode' attribute"
+    assert client.mode == "advisory", f"OSSMCPClient mode should be 'advisory', got {client.mode}"
+    print(f"✓ OSSMCPClient is advisory mode only")
+
+    assert not failed_imports, (
+        f"Failed imports: {len(failed_imports)}/{len(imports_to_test)}: {failed_imports}"
+    )
+    print(f"\n✅ All {passed_imports}/{len(imports_to_test)} OSS imports successful")
+
+
+def test_lazy_names_cached_in_globals(fresh_arf, monkeypatch):
+    """The package __getattr__ runs once per name; later lookups hit module globals"""
+    calls = []
+    lazy_getattr = fresh_arf.__getattr__
+
+    def counting_getattr(name):
+        calls.append(name)
+        return lazy_getattr(name)
+
+    monkeypatch.setattr(fresh_arf, "__getattr__", counting_getattr)
+
+    assert "HealingIntent" not in vars(fresh_arf)
+    first = fresh_arf.HealingIntent
+    second = fresh_arf.HealingIntent
+    assert first is second
+    assert vars(fresh_arf)["HealingIntent"] is first
+    assert calls == ["HealingIntent"]
+
+
+def test_oss_fallback_is_per_module(fresh_arf, monkeypatch):
+    """An unimportable core module only switches its own names to the stand-ins"""
+    fallback = "agentic_reliability_framework._oss_fallback"
+    # A None entry makes importing that module raise ImportError
+    monkeypatch.setitem(sys.modules, "agentic_reliability_framework.engine.engine_factory", None)
+
+    sources = {
+        name: getattr(fresh_arf, name).__module__
+        for name in ("EngineFactory", "create_engine", "get_engine", "HealingIntent")
+    }
+    assert sources.pop("HealingIntent") != fallback
+    assert set(sources.values()) == {fallback}, sources
+    assert fresh_arf.OSS_AVAILABLE is False
+
+
+def test_core_name_loads_only_its_module(fresh_arf):
+    """Resolving HealingIntent does not probe the other OSS core modules"""
+    fresh_arf.HealingIntent
+    assert "agentic_reliability_framework.engine.engine_factory" not in sys.modules
+
+
+def test_circular_import_prevention(fresh_arf):
+    """Test that circular imports are prevented"""
+    print("\nTesting circular import prevention...")
+
+    # Start again from an empty cache so the submodules go first
+    _drop("agentic_reliability_framework")
+
+    # Import in problematic order that could cause circular imports
+    import agentic_reliability_framework.arf_core.constants
+    import agentic_reliability_framework.arf_core.models.healing_intent
+    import agentic_reliability_framework.arf_core.engine.oss_mcp_client
+    import agentic_reliability_framework.arf_core
+
+    # Import main package
+    import agentic_reliability_framework
+
+    # Try to import everything that previously caused circular issues
+    from agentic_reliability_framework.arf_core import OSSMCPClient, HealingIntent
+    from agentic_reliability_framework.arf_core.constants import OSSBoundaryError
+    from agentic_reliability_framework.arf_core.models.healing_intent import create_rollback_intent
+    from agentic_reliability_framework.arf_core.engine.oss_mcp_client import create_oss_mcp_client
+
+    # Test that imports work both ways
+    from agentic_reliability_framework import create_mcp_client
+    from agentic_reliability_framework.arf_core.engine.oss_mcp_client import OSSMCPClient as OrigOSSMCPClient
+
+    print("✓ No circular imports detected")
+
+    # Create instances to ensure no runtime circular issues
+    intent = create_rollback_intent(component="test", revision="previous")
+    client = create_mcp_client()
+
+    print("✓ Instances created without circular dependency issues")
+
+
+def _import_self_times(stmt: str) -> Dict[str, int]:
+    """Per-module self time (us) from ``python -X importtime -c stmt``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        capture_output=True,
+        text=True,
+        cwd=_REPO_ROOT,
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        if self_us.strip().isdigit():
+            times[name.strip()] = int(self_us)
+    return times
+
+
+def _cold_import_seconds(stmt: str, repeat: int = 5) -> float:
+    """Best-of-N wall time of stmt in a fresh interpreter (no shared module cache)"""
+    code = (
+        "import time\n"
+        "t = time.perf_counter()\n"
+        f"{stmt}\n"
+        "print(time.perf_counter() - t)"
+    )
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=_REPO_ROOT,
+        )
+        assert result.returncode == 0, result.stderr
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return min(timings)
+
+
+def test_import_performance():
+    """Test that imports are performant (no excessive module loading)"""
+    print("\nTesting import performance...")
+
+    import_duration = _cold_import_seconds("import agentic_reliability_framework")
+    print(f"✓ Main package import: {import_duration:.3f}s")
+
+    component_stmt = "from agentic_reliability_framework import HealingIntent, OSSMCPClient"
+    component_duration = _cold_import_seconds(component_stmt)
+    print(f"✓ Key component imports: {component_duration:.3f}s")
+
+    # The package import is lazy, so the component import is where real
+    # submodule loading happens - both get the same budget
+    for stmt, duration in (
+        ("import agentic_reliability_framework", import_duration),
+        (component_stmt, component_duration),
+    ):
+        if duration >= 2.0:
+            times = _import_self_times(stmt)
+            slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+            pytest.fail(
+                f"Slow cold import of {stmt!r} ({duration:.3f}s); "
+                f"largest self times (us): {slowest}"
+            )
+
+
+def test_import_time_per_module():
+    """No single ARF submodule dominates a cold import of a public name"""
+    # A bare package import is lazy and loads almost nothing, so trace a
+    # name that pulls in a real submodule chain
+    times = _import_self_times("from agentic_reliability_framework import HealingIntent")
+    arf_times = {
+        name: us for name, us in times.items()
+        if name.startswith("agentic_reliability_framework.")
+    }
+    assert arf_times, "importtime trace did not include any ARF submodule"
+
+    slow = {name: us for name, us in arf_times.items() if us > _MAX_MODULE_IMPORT_US}
+    assert not slow, f"Submodules over {_MAX_MODULE_IMPORT_US // 1000} ms self import time: {slow}"
+
+
+def main() -> int:
+    """Run the checks, spread over worker processes when pytest-xdist is installed"""
+    args = [__file__, "-x"]
+    if importlib.util.find_spec("xdist") is not None:
+        # Every test imports the package from a clean module cache
+        args += ["-n", "auto"]
+    return pytest.main(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
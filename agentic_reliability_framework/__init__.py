@@ -14,166 +14,115 @@ Main package entry point with OSS boundary enforcement.
 from .__version__ import __version__
 
 # ============================================================================
-# DIRECT ABSOLUTE IMPORTS - NO CIRCULAR DEPENDENCIES
+# LAZY OSS API - NO SUBMODULE IS IMPORTED UNTIL ONE OF ITS NAMES IS USED
 # ============================================================================
 
-# IMPORTANT: Import DIRECTLY from source modules, not through intermediate modules
-# This breaks the circular dependency chain
+# Every public name resolves through __getattr__ (PEP 562) from the table
+# below, so `import agentic_reliability_framework` stays cheap and cannot
+# take part in an import cycle. Set ARF_EAGER_IMPORT=1 to resolve the whole
+# public API at import time (e.g. for CI smoke tests).
 
-try:
-    # 1. Import HealingIntent directly from its module
-    from .arf_core.models.healing_intent import (
-        HealingIntent,
-        HealingIntentSerializer,
-        create_rollback_intent,
-        create_restart_intent,
-        create_scale_out_intent,
-        create_oss_advisory_intent,
-        IntentSource,
-        IntentStatus,
-    )
-    
-    # 2. Import OSSMCPClient from the COMPREHENSIVE implementation
-    # FIXED: Use oss_mcp_client.py (1000+ lines) not simple_mcp_client.py (84 lines)
-    from .arf_core.engine.oss_mcp_client import (
-        OSSMCPClient,
-        create_oss_mcp_client,
-        OSSMCPResponse,
-        OSSAnalysisResult,
-    )
-    
-    # 3. Import constants directly
+import os as _os
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .arf_core import create_mcp_client
     from .arf_core.constants import (
-        OSS_EDITION,
-        OSS_LICENSE,
         EXECUTION_ALLOWED,
-        MCP_MODES_ALLOWED,
         MAX_INCIDENT_NODES,
         MAX_OUTCOME_NODES,
-        validate_oss_config,
-        get_oss_capabilities,
-        check_oss_compliance,
+        MCP_MODES_ALLOWED,
+        OSS_EDITION,
+        OSS_LICENSE,
         OSSBoundaryError,
+        check_oss_compliance,
+        get_oss_capabilities,
+        validate_oss_config,
+    )
+    from .arf_core.engine.oss_mcp_client import (
+        OSSAnalysisResult,
+        OSSMCPClient,
+        OSSMCPResponse,
+        create_oss_mcp_client,
     )
-    
-    # 4. Import core models
     from .arf_core.models import (
-        ReliabilityEvent,
         EventSeverity,
+        ReliabilityEvent,
         create_compatible_event,
     )
-    
-    # 5. Import engine factory from main engine module
+    from .arf_core.models.healing_intent import (
+        HealingIntent,
+        HealingIntentSerializer,
+        IntentSource,
+        IntentStatus,
+        create_oss_advisory_intent,
+        create_restart_intent,
+        create_rollback_intent,
+        create_scale_out_intent,
+    )
     from .engine.engine_factory import (
         EngineFactory,
         create_engine,
         get_engine,
         get_oss_engine_capabilities,
     )
-    
-    OSS_AVAILABLE = True
-    
-except ImportError as e:
-    OSS_AVAILABLE = False
-    # Don't print in production - use logging if needed
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.debug(f"OSS components not available during import: {e}")
-    
-    # Create minimal stubs for emergency fallback
-    class HealingIntent:
-        def __init__(self, **kwargs):
-            for key, value in kwargs.items():
-                setattr(self, key, value)
-        
-        def to_enterprise_request(self):
-            return {"error": "oss_not_available"}
-    
-    class HealingIntentSerializer:
-        @staticmethod
-        def serialize(intent):
-            return {"error": "oss_not_available"}
-    
-    def create_rollback_intent(*args, **kwargs):
-        return HealingIntent(action="rollback", component="unknown")
-    
-    def create_restart_intent(*args, **kwargs):
-        return HealingIntent(action="restart_container", component="unknown")
-    
-    def create_scale_out_intent(*args, **kwargs):
-        return HealingIntent(action="scale_out", component="unknown")
-    
-    def create_oss_advisory_intent(*args, **kwargs):
-        return HealingIntent(action="unknown", component="unknown")
-    
-    class OSSMCPClient:
-        def __init__(self, config=None):
-            self.mode = "advisory"
-            self.config = config or {}
-        
-        async def execute_tool(self, request_dict):
-            return {"error": "oss_not_available", "executed": False}
-    
-    def create_oss_mcp_client(config=None):
-        return OSSMCPClient(config)
-    
-    class OSSMCPResponse:
-        pass
-    
-    class OSSAnalysisResult:
-        pass
-    
-    class ReliabilityEvent:
-        pass
-    
-    class EventSeverity:
-        LOW = "low"
-        MEDIUM = "medium"
-        HIGH = "high"
-        CRITICAL = "critical"
-    
-    def create_compatible_event(*args, **kwargs):
-        return ReliabilityEvent()
-    
-    class EngineFactory:
-        def create_engine(self, config=None):
-            return OSSMCPClient(config)
-    
-    def create_engine(config=None):
-        return OSSMCPClient(config)
-    
-    def get_engine(config=None):
-        return OSSMCPClient(config)
-    
-    def get_oss_engine_capabilities():
-        return {"available": False}
-    
-    def validate_oss_config(config=None):
-        return {"status": "oss_not_available"}
-    
-    def get_oss_capabilities():
-        return {"available": False}
-    
-    def check_oss_compliance():
-        return False
-    
-    class OSSBoundaryError(Exception):
-        pass
-    
-    class IntentSource:
-        OSS_ANALYSIS = "oss_analysis"
-        RAG_SIMILARITY = "rag_similarity"
-    
-    class IntentStatus:
-        CREATED = "created"
-        OSS_ADVISORY_ONLY = "oss_advisory_only"
-    
-    OSS_EDITION = "open-source"
-    OSS_LICENSE = "Apache 2.0"
-    EXECUTION_ALLOWED = False
-    MCP_MODES_ALLOWED = ("advisory",)
-    MAX_INCIDENT_NODES = 1000
-    MAX_OUTCOME_NODES = 5000
+
+
+def _from(module_name: str, *names: str) -> dict[str, tuple[str, str]]:
+    """Table entries for names exported under the same name by module_name."""
+    return {name: (module_name, name) for name in names}
+
+
+# OSS core: a name is served from ._oss_fallback when its real module cannot
+# be imported
+_oss_module_attr: dict[str, tuple[str, str]] = {
+    **_from(
+        ".arf_core.models.healing_intent",
+        "HealingIntent",
+        "HealingIntentSerializer",
+        "create_rollback_intent",
+        "create_restart_intent",
+        "create_scale_out_intent",
+        "create_oss_advisory_intent",
+        "IntentSource",
+        "IntentStatus",
+    ),
+    **_from(
+        ".arf_core.engine.oss_mcp_client",
+        "OSSMCPClient",
+        "create_oss_mcp_client",
+        "OSSMCPResponse",
+        "OSSAnalysisResult",
+    ),
+    **_from(".arf_core", "create_mcp_client"),
+    **_from(
+        ".arf_core.constants",
+        "OSS_EDITION",
+        "OSS_LICENSE",
+        "EXECUTION_ALLOWED",
+        "MCP_MODES_ALLOWED",
+        "MAX_INCIDENT_NODES",
+        "MAX_OUTCOME_NODES",
+        "validate_oss_config",
+        "get_oss_capabilities",
+        "check_oss_compliance",
+        "OSSBoundaryError",
+    ),
+    **_from(
+        ".arf_core.models",
+        "ReliabilityEvent",
+        "EventSeverity",
+        "create_compatible_event",
+    ),
+    **_from(
+        ".engine.engine_factory",
+        "EngineFactory",
+        "create_engine",
+        "get_engine",
+        "get_oss_engine_capabilities",
+    ),
+}
 
 # ============================================================================
 # PUBLIC API - MINIMAL & CLEAN
@@ -215,6 +164,7 @@ __all__ = [
     "OSSMCPResponse",
     "OSSAnalysisResult",
     "create_oss_mcp_client",
+    "create_mcp_client",
     
     # Engine Factory
     "EngineFactory",
@@ -227,14 +177,12 @@ __all__ = [
 ]
 
 # ============================================================================
-# LAZY LOADING FOR HEAVY MODULES ONLY
+# LAZY LOADING FOR HEAVY MODULES
 # ============================================================================
 
-from importlib import import_module
-from typing import Any
-
-# Map for lazy loading of non-core components
+# Map for lazy loading of non-core components (no fallback)
 _map_module_attr: dict[str, tuple[str, str]] = {
+    **_oss_module_attr,
     # App components (not part of OSS core)
     "SimplePredictiveEngine": (".engine.predictive", "SimplePredictiveEngine"),
     "BusinessImpactCalculator": (".engine.business", "BusinessImpactCalculator"),
@@ -249,27 +197,84 @@ _map_module_attr: dict[str, tuple[str, str]] = {
     "MCPResponse": (".engine.mcp_server", "MCPResponse"),
 }
 
+
+# OSS core module name -> module its names are actually served from
+_oss_module_source: dict[str, Any] = {}
+
+
+def _resolve_oss_module(module_name: str) -> Any:
+    """The real OSS core module, or ._oss_fallback if it cannot be imported.
+
+    Decided once per module, so the names one module exports always come
+    from the same place. Modules are probed only when one of their names is
+    used, so touching HealingIntent does not import the engine factory.
+    """
+    if module_name not in _oss_module_source:
+        try:
+            module = _import_module(module_name, package=__package__)
+        except ImportError as exc:
+            import logging
+            logging.getLogger(__name__).debug(
+                "OSS component %s not available, using stand-ins: %s",
+                module_name, exc,
+            )
+            module = _import_module("._oss_fallback", package=__package__)
+        _oss_module_source[module_name] = module
+    return _oss_module_source[module_name]
+
+
+def _oss_available() -> bool:
+    """Whether every OSS core module imports (the real API is in use)."""
+    fallback = _import_module("._oss_fallback", package=__package__)
+    return all(
+        _resolve_oss_module(module_name) is not fallback
+        for module_name in dict.fromkeys(m for m, _ in _oss_module_attr.values())
+    )
+
+
+def _oss_api_available() -> bool:
+    """OSS_AVAILABLE, computed on first use and then fixed for the process.
+
+    This probes every OSS core module, so only read it when the full answer
+    is needed; resolving individual names does not go through it.
+    """
+    if "OSS_AVAILABLE" not in globals():
+        globals()["OSS_AVAILABLE"] = _oss_available()
+    return globals()["OSS_AVAILABLE"]
+
+
 def __getattr__(name: str) -> Any:
     """
-    Lazy-load heavy modules on attribute access.
-    OSS core components are already imported above.
+    Lazy-load public names on attribute access.
+    
+    Python only calls this for names missing from the module globals, and a
+    resolved name is stored there, so each lazy name is loaded at most once.
+    Whether an OSS core name comes from its real module or from the inert
+    stand-ins in ._oss_fallback is decided per module: only that module is
+    imported, at the cost that a degraded environment may serve real names
+    from healthy modules next to stand-ins for the broken one.
     """
-    if name in globals():
-        return globals()[name]
+    if name == "OSS_AVAILABLE":
+        return _oss_api_available()
     
     entry = _map_module_attr.get(name)
     if entry is None:
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
     module_name, attr_name = entry
-    
-    try:
-        module = import_module(module_name, package=__package__)
-        return getattr(module, attr_name)
-    except ImportError as exc:
-        raise AttributeError(
-            f"Could not lazy-load {name} from {module_name}: {exc}"
-        ) from exc
+    if name in _oss_module_attr:
+        module = _resolve_oss_module(module_name)
+    else:
+        try:
+            module = _import_module(module_name, package=__package__)
+        except ImportError as exc:
+            raise AttributeError(
+                f"Could not lazy-load {name} from {module_name}: {exc}"
+            ) from exc
+    
+    value = getattr(module, attr_name)
+    globals()[name] = value
+    return value
 
 
 def __dir__() -> list[str]:
@@ -277,6 +282,13 @@ def __dir__() -> list[str]:
     std = set(globals().keys())
     return sorted(std.union(__all__))
 
+
+if _os.environ.get("ARF_EAGER_IMPORT"):
+    for _name in __all__:
+        if _name not in globals():
+            __getattr__(_name)
+    del _name
+
 # ============================================================================
 # NO PRINT STATEMENTS ON IMPORT - Use logging if needed
 # ============================================================================
@@ -0,0 +1,106 @@
+# agentic_reliability_framework/_oss_fallback.py
+"""
+Emergency stand-ins for the OSS public API.
+
+The package __init__ resolves OSS names lazily; when the real module for one
+of them cannot be imported, the name is served from here instead so that
+`from agentic_reliability_framework import X` keeps working in a degraded
+environment. Nothing here executes anything.
+"""
+
+class HealingIntent:
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def to_enterprise_request(self):
+        return {"error": "oss_not_available"}
+
+class HealingIntentSerializer:
+    @staticmethod
+    def serialize(intent):
+        return {"error": "oss_not_available"}
+
+def create_rollback_intent(*args, **kwargs):
+    return HealingIntent(action="rollback", component="unknown")
+
+def create_restart_intent(*args, **kwargs):
+    return HealingIntent(action="restart_container", component="unknown")
+
+def create_scale_out_intent(*args, **kwargs):
+    return HealingIntent(action="scale_out", component="unknown")
+
+def create_oss_advisory_intent(*args, **kwargs):
+    return HealingIntent(action="unknown", component="unknown")
+
+class OSSMCPClient:
+    def __init__(self, config=None):
+        self.mode = "advisory"
+        self.config = config or {}
+
+    async def execute_tool(self, request_dict):
+        return {"error": "oss_not_available", "executed": False}
+
+def create_oss_mcp_client(config=None):
+    return OSSMCPClient(config)
+
+def create_mcp_client(config=None):
+    return OSSMCPClient(config)
+
+class OSSMCPResponse:
+    pass
+
+class OSSAnalysisResult:
+    pass
+
+class ReliabilityEvent:
+    pass
+
+class EventSeverity:
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+def create_compatible_event(*args, **kwargs):
+    return ReliabilityEvent()
+
+class EngineFactory:
+    def create_engine(self, config=None):
+        return OSSMCPClient(config)
+
+def create_engine(config=None):
+    return OSSMCPClient(config)
+
+def get_engine(config=None):
+    return OSSMCPClient(config)
+
+def get_oss_engine_capabilities():
+    return {"available": False}
+
+def validate_oss_config(config=None):
+    return {"status": "oss_not_available"}
+
+def get_oss_capabilities():
+    return {"available": False}
+
+def check_oss_compliance():
+    return False
+
+class OSSBoundaryError(Exception):
+    pass
+
+class IntentSource:
+    OSS_ANALYSIS = "oss_analysis"
+    RAG_SIMILARITY = "rag_similarity"
+
+class IntentStatus:
+    CREATED = "created"
+    OSS_ADVISORY_ONLY = "oss_advisory_only"
+
+OSS_EDITION = "open-source"
+OSS_LICENSE = "Apache 2.0"
+EXECUTION_ALLOWED = False
+MCP_MODES_ALLOWED = ("advisory",)
+MAX_INCIDENT_NODES = 1000
+MAX_OUTCOME_NODES = 5000
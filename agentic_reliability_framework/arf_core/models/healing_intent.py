@@ -16,16 +16,30 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the complete language governing permissions and limitations under the License.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Dict, Any, Optional, List, ClassVar, TYPE_CHECKING, Union
-from datetime import datetime
+from datetime import date, datetime, time as dt_time
 import hashlib
 import json
+import math
+import struct
 import time
 import uuid
 from enum import Enum
 from copy import deepcopy
 
+# Optional fast JSON encoder - stdlib json is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional binary encoding for the Enterprise handoff
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from ..constants import (
     OSS_EDITION,
     OSS_LICENSE,
@@ -75,6 +89,23 @@ class IntentStatus(str, Enum):
     OSS_ADVISORY_ONLY = "oss_advisory_only"  # New: OSS can only advise
 
 
+def _copy_plain(value: Any) -> Any:
+    """
+    Copy the dict/list/tuple containers of JSON-style data
+    
+    Equivalent to dataclasses.asdict() for intent fields (which only hold
+    plain data), without its per-leaf deepcopy; immutable leaves are shared.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {k: _copy_plain(v) for k, v in value.items()}
+    if value_type is list:
+        return [_copy_plain(v) for v in value]
+    if value_type is tuple:
+        return tuple(_copy_plain(v) for v in value)
+    return value
+
+
 @dataclass(frozen=True, slots=True)
 class HealingIntent:
     """
@@ -368,7 +399,7 @@ class HealingIntent:
         Returns:
             Dictionary representation of the intent
         """
-        data = asdict(self)
+        data = {name: _copy_plain(getattr(self, name)) for name in _INTENT_FIELD_NAMES}
         
         # Convert enums to strings
         data["source"] = self.source.value
@@ -791,6 +822,10 @@ class HealingIntent:
             return True
 
 
+# Resolved once; to_dict() walks these instead of calling asdict()
+_INTENT_FIELD_NAMES = tuple(f.name for f in fields(HealingIntent))
+
+
 class HealingIntentSerializer:
     """
     Versioned serialization for HealingIntent
@@ -823,13 +858,15 @@ class HealingIntentSerializer:
         """
         try:
             if version == "1.1.0":
+                data = intent.to_dict(include_oss_context=True)
                 return {
                     "version": version,
                     "schema_version": cls.SCHEMA_VERSION,
-                    "data": intent.to_dict(include_oss_context=True),
+                    "data": data,
                     "metadata": {
                         "serialized_at": time.time(),
-                        "deterministic_id": intent.deterministic_id,
+                        # Already hashed by to_dict()
+                        "deterministic_id": data["deterministic_id"],
                         "is_executable": intent.is_executable,
                         "is_oss_advisory": intent.is_oss_advisory,
                         "requires_enterprise_upgrade": intent.requires_enterprise_upgrade,
@@ -851,7 +888,7 @@ class HealingIntentSerializer:
                     "data": data,
                     "metadata": {
                         "serialized_at": time.time(),
-                        "deterministic_id": intent.deterministic_id,
+                        "deterministic_id": data["deterministic_id"],
                         "is_executable": intent.is_executable,
                     }
                 }
@@ -898,15 +935,70 @@ class HealingIntentSerializer:
         except Exception as e:
             raise SerializationError(f"Failed to deserialize HealingIntent: {e}") from e
     
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """Encode values JSON lacks the way orjson does natively"""
+        if isinstance(obj, (datetime, date, dt_time)):
+            return obj.isoformat()
+        if isinstance(obj, Enum):
+            return obj.value
+        return str(obj)
+    
+    @staticmethod
+    def _reject_non_finite(data: Any) -> None:
+        """Raise ValueError if data holds a NaN or infinite float anywhere"""
+        stack = [data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, float):
+                if not math.isfinite(value):
+                    raise ValueError(
+                        f"Out of range float values are not JSON compliant: {value!r}"
+                    )
+            elif isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
+    
+    @classmethod
+    def _dumps(cls, data: Any, pretty: bool = False) -> bytes:
+        """
+        Encode data as UTF-8 JSON, using orjson when it is installed
+        
+        Both encoders use the same layout (compact separators, raw UTF-8,
+        ISO 8601 datetimes, enums by value), so the decoded payload does not
+        depend on which one is available. Float spelling can differ (orjson
+        writes 1e16, the stdlib 1e+16). NaN and infinities are rejected on
+        both paths, since orjson would silently write null for them.
+        """
+        cls._reject_non_finite(data)
+        if orjson is not None:
+            try:
+                option = orjson.OPT_INDENT_2 if pretty else 0
+                return orjson.dumps(data, default=cls._json_default, option=option)
+            except TypeError:
+                # e.g. non-str keys in parameters; stdlib json handles those
+                pass
+        return json.dumps(
+            data,
+            indent=2 if pretty else None,
+            separators=(",", ": ") if pretty else (",", ":"),
+            ensure_ascii=False,
+            allow_nan=False,
+            default=cls._json_default,
+        ).encode()
+    
     @classmethod
     def to_json(cls, intent: HealingIntent, pretty: bool = False) -> str:
         """Convert HealingIntent to JSON string"""
+        return cls.to_json_bytes(intent, pretty=pretty).decode()
+    
+    @classmethod
+    def to_json_bytes(cls, intent: HealingIntent, pretty: bool = False) -> bytes:
+        """Convert HealingIntent to UTF-8 encoded JSON"""
         try:
             serialized = cls.serialize(intent)
-            if pretty:
-                return json.dumps(serialized, indent=2, default=str)
-            else:
-                return json.dumps(serialized, default=str)
+            return cls._dumps(serialized, pretty=pretty)
         except Exception as e:
             raise SerializationError(f"Failed to convert to JSON: {e}") from e
     
@@ -928,12 +1020,47 @@ class HealingIntentSerializer:
         
         This is what should be sent to the Enterprise API
         """
+        return cls.to_enterprise_json_bytes(intent).decode()
+    
+    @classmethod
+    def to_enterprise_json_bytes(cls, intent: HealingIntent) -> bytes:
+        """
+        Enterprise-ready JSON as UTF-8 bytes
+        
+        Avoids a str round-trip when the payload goes straight to a file
+        or socket; with orjson installed the encoder output is returned as-is.
+        """
         try:
-            enterprise_request = intent.to_enterprise_request()
-            return json.dumps(enterprise_request, default=str)
+            request = intent.to_enterprise_request()
+            return cls._dumps(request)
         except Exception as e:
             raise SerializationError(f"Failed to create Enterprise JSON: {e}") from e
     
+    @classmethod
+    def to_enterprise_msgpack(cls, intent: HealingIntent, framed: bool = False) -> bytes:
+        """
+        Convert to Enterprise-ready MessagePack (excludes OSS context)
+        
+        Same payload as to_enterprise_json in a compact binary form, for
+        Enterprise consumers that accept it. Requires the optional msgpack
+        package.
+        
+        Args:
+            intent: HealingIntent to convert
+            framed: Prefix the payload with its length as a 4-byte big-endian
+                integer, so several intents can be streamed back to back
+        """
+        if msgpack is None:
+            raise SerializationError("MessagePack output requires the 'msgpack' package")
+        try:
+            request = intent.to_enterprise_request()
+            payload = msgpack.packb(request, use_bin_type=True, default=str)
+            if framed:
+                return struct.pack(">I", len(payload)) + payload
+            return payload
+        except Exception as e:
+            raise SerializationError(f"Failed to create Enterprise MessagePack: {e}") from e
+    
     @classmethod
     def validate_for_oss(cls, intent: HealingIntent) -> bool:
         """
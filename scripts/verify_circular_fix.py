@@ -7,9 +7,23 @@ This script can be run directly in GitHub UI by clicking "Run" button
 """
 
 import sys
-import traceback
-import importlib
-import warnings
+
+
+# Set by --verbose: print full tracebacks for failed imports
+VERBOSE = False
+
+
+def _brief(e):
+    """One-line 'Type: message' summary of e, without walking its frames"""
+    import traceback
+    return "".join(traceback.format_exception_only(type(e), e)).strip()
+
+
+def _report_exc():
+    """Print the active exception's traceback in verbose mode (traceback is only loaded on failure)"""
+    if VERBOSE:
+        import traceback
+        traceback.print_exc()
 
 
 def clear_module_cache():
@@ -49,11 +63,11 @@ def test_import_no_circular():
         tests.append(("Main package", True, f"v{version}"))
     except RecursionError as e:
         tests.append(("Main package", False, f"❌ RecursionError: {e}"))
-        traceback.print_exc()
+        _report_exc()
         return False, tests  # Critical failure
     except Exception as e:
-        tests.append(("Main package", False, f"❌ Error: {type(e).__name__}: {e}"))
-        traceback.print_exc()
+        tests.append(("Main package", False, f"❌ Error: {_brief(e)}"))
+        _report_exc()
     
     # Test 2: Import arf_core directly
     try:
@@ -61,11 +75,11 @@ def test_import_no_circular():
         tests.append(("arf_core module", True, "✅ Import successful"))
     except RecursionError as e:
         tests.append(("arf_core module", False, f"❌ RecursionError: {e}"))
-        traceback.print_exc()
+        _report_exc()
         return False, tests
     except Exception as e:
-        tests.append(("arf_core module", False, f"❌ Error: {type(e).__name__}: {e}"))
-        traceback.print_exc()
+        tests.append(("arf_core module", False, f"❌ Error: {_brief(e)}"))
+        _report_exc()
     
     # Test 3: Import OSS components
     try:
@@ -73,11 +87,11 @@ def test_import_no_circular():
         tests.append(("HealingIntent", True, "✅ Import successful"))
     except RecursionError as e:
         tests.append(("HealingIntent", False, f"❌ RecursionError: {e}"))
-        traceback.print_exc()
+        _report_exc()
         return False, tests
     except Exception as e:
-        tests.append(("HealingIntent", False, f"❌ Error: {type(e).__name__}: {e}"))
-        traceback.print_exc()
+        tests.append(("HealingIntent", False, f"❌ Error: {_brief(e)}"))
+        _report_exc()
     
     # Test 4: Import OSSMCPClient
     try:
@@ -85,11 +99,11 @@ def test_import_no_circular():
         tests.append(("OSSMCPClient", True, "✅ Import successful"))
     except RecursionError as e:
         tests.append(("OSSMCPClient", False, f"❌ RecursionError: {e}"))
-        traceback.print_exc()
+        _report_exc()
         return False, tests
     except Exception as e:
-        tests.append(("OSSMCPClient", False, f"❌ Error: {type(e).__name__}: {e}"))
-        traceback.print_exc()
+        tests.append(("OSSMCPClient", False, f"❌ Error: {_brief(e)}"))
+        _report_exc()
     
     # Test 5: Test the problematic chain
     try:
@@ -97,11 +111,11 @@ def test_import_no_circular():
         tests.append(("Constants module", True, "✅ Import successful"))
     except RecursionError as e:
         tests.append(("Constants module", False, f"❌ RecursionError: {e}"))
-        traceback.print_exc()
+        _report_exc()
         return False, tests
     except Exception as e:
-        tests.append(("Constants module", False, f"❌ Error: {type(e).__name__}: {e}"))
-        traceback.print_exc()
+        tests.append(("Constants module", False, f"❌ Error: {_brief(e)}"))
+        _report_exc()
     
     # Test 6: Test oss_mcp_client import (UPDATED - was simple_mcp_client)
     try:
@@ -109,11 +123,11 @@ def test_import_no_circular():
         tests.append(("oss_mcp_client", True, "✅ Import successful"))
     except RecursionError as e:
         tests.append(("oss_mcp_client", False, f"❌ RecursionError: {e}"))
-        traceback.print_exc()
+        _report_exc()
         return False, tests
     except Exception as e:
-        tests.append(("oss_mcp_client", False, f"❌ Error: {type(e).__name__}: {e}"))
-        traceback.print_exc()
+        tests.append(("oss_mcp_client", False, f"❌ Error: {_brief(e)}"))
+        _report_exc()
     
     # Test 7: Test healing_intent import
     try:
@@ -121,11 +135,11 @@ def test_import_no_circular():
         tests.append(("healing_intent", True, "✅ Import successful"))
     except RecursionError as e:
         tests.append(("healing_intent", False, f"❌ RecursionError: {e}"))
-        traceback.print_exc()
+        _report_exc()
         return False, tests
     except Exception as e:
-        tests.append(("healing_intent", False, f"❌ Error: {type(e).__name__}: {e}"))
-        traceback.print_exc()
+        tests.append(("healing_intent", False, f"❌ Error: {_brief(e)}"))
+        _report_exc()
     
     # Test 8: Test factory functions
     try:
@@ -297,8 +311,10 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description="Verify circular import fixes")
     parser.add_argument("--quick", action="store_true", help="Run quick test only")
+    parser.add_argument("--verbose", action="store_true", help="Print full tracebacks for failed imports")
     
     args = parser.parse_args()
+    VERBOSE = args.verbose
     
     if args.quick:
         success = quick_test()